@@ -6,9 +6,19 @@ import os
 import tempfile
 import subprocess
 import json
+import time
+import hashlib
+import math
+import shutil
+import sqlite3
+import threading
+import ctypes
+from collections import deque
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 from functools import partial
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 os.environ["LC_NUMERIC"] = "C"
 is_wayland = os.environ.get("XDG_SESSION_TYPE") == "wayland"
@@ -17,14 +27,18 @@ import mpv
 from mpv import MpvRenderContext, MpvGlGetProcAddressFn
 
 from PyQt6.QtCore import (
-    Qt, QTimer, QPoint, QPropertyAnimation, QEvent, QEasingCurve, pyqtSignal, QObject
+    Qt, QTimer, QPoint, QPropertyAnimation, QEvent, QEasingCurve, pyqtSignal, pyqtSlot, QObject, QThread
 )
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QSlider, QWidget, QPushButton, QVBoxLayout,
-    QHBoxLayout, QFileDialog, QLabel, QSizePolicy, QMenu, QToolButton, QScrollArea, QStyle
+    QHBoxLayout, QFileDialog, QLabel, QSizePolicy, QMenu, QToolButton, QScrollArea, QStyle,
+    QDialog, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox
 )
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtGui import QShortcut, QCursor
+from PyQt6.QtOpenGL import QOpenGLFramebufferObject
+from PyQt6.QtGui import (
+    QShortcut, QCursor, QImage, QPixmap, QPainter, QOffscreenSurface, QOpenGLContext, QSurfaceFormat
+)
 
 # ----------------------------- Settings & Themes ----------------------------- #
 
@@ -37,6 +51,15 @@ def get_settings():
 
 SETTINGS_FILE = get_settings()
 
+def get_cache_dir():
+    app_name = "CrustyMediaPlayer"
+    home = os.path.expanduser("~")
+    cache_dir = os.path.join(home, ".cache", app_name)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+CACHE_DIR = get_cache_dir()
+
 def load_settings():
     """Load all settings from file"""
     default_settings = {
@@ -45,7 +68,26 @@ def load_settings():
         "remember_volumes": False,
         "saved_volumes": {},  # Will store volume levels
         "hide_controls_on_start": False,
-        "fullscreen_on_start": False
+        "fullscreen_on_start": False,
+        "extract_workers": 0,  # Parallel ffmpeg extractions, 0 = automatic (see default_extract_workers)
+        "progressive_playback": False,  # Start playing while tracks are still extracting
+        "playback_head_start": 5.0,  # Seconds of audio to buffer before progressive playback starts
+        "cache_budget_mb": 2048,  # Disk budget for extracted tracks kept between runs, 0 = no cache
+        "audio_mode": "extract",  # "extract" tracks to files, "direct" from the source file, or "mixer"
+        "extract_format": "wav",  # Intermediate format for extracted tracks, see EXTRACT_FORMATS
+        "extract_passthrough": False,  # Keep each track's own sample rate and channel layout
+        "probe_db_max_rows": 20000,  # Probe results remembered between runs, 0 = always probe
+        "probe_backend": "mpv",  # "mpv" reads track-list from the video player's libmpv, "ffprobe" always forks
+        "sync_deadband_ms": 15,  # Audio drift smaller than this is left alone
+        "sync_gain": 0.5,  # Speed change per second of drift; higher converges faster but can overshoot
+        "sync_max_correction": 0.05,  # Largest speed change used to pull a track back (0.05 = +/-5%)
+        "sync_hard_seek_ms": 1000,  # Drift beyond this is fixed with a seek instead of a speed change
+        "sync_history": 200,  # Drift samples kept per track for the drift statistics
+        "sync_smoothing": 9,  # Corrections act on the median of this many recent drift samples
+        "thumbnail_interval": 10,  # Seconds between timeline hover thumbnails, 0 = no thumbnails
+        "thumbnail_cache_mb": 256,  # Disk budget for thumbnail sprite sheets
+        "show_frame_stats": False,  # Frame pacing/dropped frame overlay on the video
+        "video_renderer": "auto"  # "opengl", "software" (no GL needed), or "auto" (software when GL is unusable)
     }
     
     if os.path.exists(SETTINGS_FILE):
@@ -234,11 +276,20 @@ QPushButton#closebutton:hover {
 BORDER_SIZE = 8
 
 # ------------------------------ Video Player ------------------------------ #
-class VideoPlayer(QOpenGLWidget):
+FRAME_STATS_SIZE = 600  # samples per frame statistics ring buffer (10 s at 60 fps)
+CLOCK_MAX_EXTRAPOLATION = 0.1  # seconds clock() runs on past the last time-pos change (covers 10 fps)
+
+class VideoPlayerBase:
+    """mpv playback, the position pipeline, scrubbing and frame statistics shared by the video
+    widgets. Subclasses (mixed with a QWidget type) create the render context and paint frames."""
     position_changed = pyqtSignal(int)
     duration_changed = pyqtSignal(int)
     state_changed = pyqtSignal(bool)
     first_frame_ready = pyqtSignal()
+    # internal: the time-pos observer (mpv's event thread) telling the GUI thread a new position is in
+    _position_observed = pyqtSignal()
+    # internal: mpv's render thread asking the GUI thread for a repaint
+    _repaint_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -248,10 +299,49 @@ class VideoPlayer(QOpenGLWidget):
         self._duration = 0
         self._is_playing = False
         self._current_file = None
-
-        self.position_timer = QTimer(self)
-        self.position_timer.setInterval(100)
-        self.position_timer.timeout.connect(self._poll_position)
+        self._preloaded_file = None  # opened (paused) by probe(), set_media doesn't need to load it again
+
+        # Position pipeline: the time-pos observer stores the newest value and position_changed
+        # delivers it at most once per display frame. Nothing runs while mpv isn't moving.
+        self._pos_ms = 0
+        self._pos_pending = False
+        self._pos_sample = (None, 0.0)  # (time-pos in seconds, perf_counter when it changed), see clock()
+        self.position_tick = QTimer(self)
+        self.position_tick.setSingleShot(True)
+        self.position_tick.timeout.connect(self._deliver_position)
+        self._position_observed.connect(self._schedule_position)
+
+        # Repaint bridge: at most one repaint request queued to the GUI thread, callbacks that
+        # arrive while one is pending are dropped (the pending repaint renders the newest frame)
+        self._repaint_pending = False
+        self.repaints_delivered = 0  # update() calls made for mpv
+        self.repaints_coalesced = 0  # mpv update callbacks folded into a pending repaint
+        self._repaint_requested.connect(self._deliver_repaint, Qt.ConnectionType.QueuedConnection)
+
+        # Live scrubbing: one keyframe seek in flight at a time, newer targets replace the queued one
+        self._scrub_lock = threading.Lock()
+        self._scrub_in_flight = False
+        self._scrub_started = 0.0
+        self._scrub_target = None
+        self.scrub_requests = 0  # positions asked for while dragging
+        self.scrub_seeks = 0     # seeks actually sent to mpv
+
+        # Frame pacing statistics, see frame_stats()
+        self.render_times = deque(maxlen=FRAME_STATS_SIZE)     # ms spent in ctx.render per paint
+        self.frame_intervals = deque(maxlen=FRAME_STATS_SIZE)  # ms between consecutive paints
+        self.vo_drops = deque(maxlen=FRAME_STATS_SIZE)         # (time, frame-drop-count) as it changes
+        self.decoder_drops = deque(maxlen=FRAME_STATS_SIZE)    # (time, decoder-frame-drop-count)
+        self._last_paint = None
+
+        self.stats_overlay = QLabel(self)
+        self.stats_overlay.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 160); color: white; font-family: monospace; padding: 4px;"
+        )
+        self.stats_overlay.move(8, 8)
+        self.stats_overlay.hide()
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(500)
+        self.stats_timer.timeout.connect(self._update_stats_overlay)
 
         # Set size policy to expand and fill available space
         self.setSizePolicy(
@@ -259,15 +349,13 @@ class VideoPlayer(QOpenGLWidget):
             QSizePolicy.Policy.Expanding
         )
 
-    # ---------------- OpenGL / mpv ---------------- #
+    # ---------------- mpv ---------------- #
 
-    def initializeGL(self):
-        # Ensure context is current (CRITICAL on Wayland)
-        self.makeCurrent()
-
-        self.mpv = mpv.MPV(
+    def create_mpv(self, hwdec):
+        """The libmpv-rendered instance both widgets use"""
+        return mpv.MPV(
             vo="libmpv",
-            hwdec="auto-safe",
+            hwdec=hwdec,
             keep_open=True,
             idle=True,
             input_default_bindings=False,
@@ -277,10 +365,21 @@ class VideoPlayer(QOpenGLWidget):
             keepaspect=True,
         )
 
+    def attach_mpv(self, player):
+        """Use `player` as this widget's mpv instance and hook up the position/duration/pause pipeline.
+
+        The widgets attach a create_mpv() instance when first shown; headless tools can attach one with vo=null.
+        """
+        self.mpv = player
+
         @self.mpv.property_observer("time-pos")
         def _(name, value):
             if value is not None:
-                self.position_changed.emit(int(value * 1000))
+                self._pos_sample = (value, time.perf_counter())
+                self._pos_ms = int(value * 1000)
+                if not self._pos_pending:
+                    self._pos_pending = True
+                    self._position_observed.emit()
 
         @self.mpv.property_observer("duration")
         def _(name, value):
@@ -290,72 +389,144 @@ class VideoPlayer(QOpenGLWidget):
 
         @self.mpv.property_observer("pause")
         def _(name, value):
+            # clock() extrapolates from here on resume, not from before the pause
+            self._pos_sample = (self._pos_sample[0], time.perf_counter())
             self._is_playing = not value
             self.state_changed.emit(self._is_playing)
 
-        # -------- SAFE proc address wrapper -------- #
-        # Create a proper ctypes callback function
-        @MpvGlGetProcAddressFn
-        def get_proc_address(_, name):
-            # Keep name as bytes - Qt expects bytes
-            if not isinstance(name, bytes):
-                name = name.encode('utf-8')
-            addr = self.context().getProcAddress(name)
-            if addr is None:
-                return 0  # MUST return 0, not None
-            return int(addr)
+        @self.mpv.event_callback("playback-restart")
+        def _(event):
+            self._on_playback_restart()
 
-        self.ctx = MpvRenderContext(
-            self.mpv,
-            api_type="opengl",
-            opengl_init_params={
-                "get_proc_address": get_proc_address
-            }
-        )
+        @self.mpv.property_observer("frame-drop-count")
+        def _(name, value):
+            if value is not None:
+                self.vo_drops.append((time.monotonic(), value))
 
-        # Set update callback to trigger repaints
-        self.ctx.update_cb = self.on_mpv_update
+        @self.mpv.property_observer("decoder-frame-drop-count")
+        def _(name, value):
+            if value is not None:
+                self.decoder_drops.append((time.monotonic(), value))
 
     def on_mpv_update(self):
-        """Called by MPV when it needs a repaint"""
-        if self.isValid():
+        """Called by MPV (from its own thread) when it needs a repaint"""
+        if self._repaint_pending:
+            self.repaints_coalesced += 1
+            return
+        self._repaint_pending = True
+        self._repaint_requested.emit()
+
+    def _deliver_repaint(self):
+        # Clear first so a frame arriving from here on queues a new repaint
+        self._repaint_pending = False
+        if self.render_ready():
+            self.repaints_delivered += 1
             self.update()
 
-    def paintGL(self):
-        if not self.ctx:
-            return
+    def render_ready(self):
+        return self.ctx is not None
 
-        # Emit once when we actually have a real GL paint (prevents "huge then snap")
+    def _begin_frame(self):
+        """Paint bookkeeping before rendering; returns the start time to pass to _end_frame"""
+        # Emit once when we actually have a real paint (prevents "huge then snap")
         if not getattr(self, "_first_frame_emitted", False):
             self._first_frame_emitted = True
             self.first_frame_ready.emit()
 
-        # Get the actual framebuffer size (important for high DPI displays)
-        ratio = self.devicePixelRatioF()
-        w = int(self.width() * ratio)
-        h = int(self.height() * ratio)
-
-        self.ctx.render(
-            flip_y=True,
-            opengl_fbo={
-                "fbo": self.defaultFramebufferObject(),
-                "w": w,
-                "h": h,
-            },
-        )
+        start = time.perf_counter()
+        if self._last_paint is not None:
+            interval = (start - self._last_paint) * 1000
+            # A gap of over a second is a pause, not a slow frame
+            if interval < 1000:
+                self.frame_intervals.append(interval)
+        self._last_paint = start
+        return start
+
+    def _end_frame(self, start):
+        self.render_times.append((time.perf_counter() - start) * 1000)
+
+    # ---------------- Frame statistics ---------------- #
+
+    def frame_stats(self):
+        """Percentiles (p50/p95/p99/max, ms) of render time and frame interval over the ring buffers,
+        the paint rate, mpv's dropped-frame counters (total and within the buffered window) and
+        the repaint bridge counters"""
+        def percentiles(values):
+            values = list(values)
+            if not values:
+                return None
+            return {
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "p99": _percentile(values, 99),
+                "max": max(values),
+            }
 
-    def resizeGL(self, w, h):
-        """Handle widget resize events"""
-        if self.ctx:
-            self.update()
+        def drops(samples):
+            samples = list(samples)
+            if not samples:
+                return 0, 0
+            return samples[-1][1], samples[-1][1] - samples[0][1]
+
+        intervals = list(self.frame_intervals)
+        vo_total, vo_recent = drops(self.vo_drops)
+        decoder_total, decoder_recent = drops(self.decoder_drops)
+        return {
+            "render_ms": percentiles(self.render_times),
+            "interval_ms": percentiles(intervals),
+            "fps": 1000 * len(intervals) / sum(intervals) if intervals else 0.0,
+            "vo_drops": vo_total,
+            "vo_drops_recent": vo_recent,
+            "decoder_drops": decoder_total,
+            "decoder_drops_recent": decoder_recent,
+            "repaints_delivered": self.repaints_delivered,
+            "repaints_coalesced": self.repaints_coalesced,
+        }
+
+    def set_stats_overlay(self, visible):
+        self.stats_overlay.setVisible(visible)
+        if visible:
+            self._update_stats_overlay()
+            self.stats_timer.start()
+        else:
+            self.stats_timer.stop()
+
+    def _update_stats_overlay(self):
+        stats = self.frame_stats()
+        lines = [f"paint rate   {stats['fps']:6.1f} fps"]
+        for key, label in (("interval_ms", "interval"), ("render_ms", "render")):
+            p = stats[key]
+            if p:
+                lines.append(f"{label:<12} p50 {p['p50']:5.1f}  p95 {p['p95']:5.1f}  p99 {p['p99']:5.1f}  max {p['max']:5.1f} ms")
+        lines.append(f"dropped vo   {stats['vo_drops']} ({stats['vo_drops_recent']} recent)")
+        lines.append(f"dropped dec  {stats['decoder_drops']} ({stats['decoder_drops_recent']} recent)")
+        lines.append(f"repaints     {stats['repaints_delivered']} ({stats['repaints_coalesced']} coalesced)")
+        self.stats_overlay.setText("\n".join(lines))
+        self.stats_overlay.adjustSize()
 
     # ---------------- Media control ---------------- #
 
     def set_media(self, path):
         self._current_file = path
-        self.mpv.play(path)
+        if self._preloaded_file != path:
+            self.mpv.play(path)
+        self._preloaded_file = None
+        self._cancel_position()
+        self._pos_ms = 0
+        self._pos_sample = (None, 0.0)  # clock() waits for the new file's first time-pos
         self.mpv.pause = True
-        self.position_timer.start()
+
+    def probe(self, path, timeout=5.0):
+        """Read stream info for `path` from this player's own mpv instance (no ffprobe process).
+
+        The file stays loaded and paused, so set_media for it afterwards is free. Safe to call from a
+        worker thread since libmpv's client API is thread-safe. Returns a MediaInfo or None.
+        """
+        if not self.mpv:
+            return None
+        info = probe_with_mpv(self.mpv, path, timeout)
+        self._preloaded_file = path if info is not None else None
+        return info
 
     def set_video_muted(self):
         # Mute the video player so we only hear the extracted audio tracks
@@ -378,20 +549,45 @@ class VideoPlayer(QOpenGLWidget):
     def stop(self):
         if self.mpv:
             self.mpv.command("stop")
-            self.position_timer.stop()
+            self._cancel_position()
+            self._pos_ms = 0
+            self._pos_sample = (None, 0.0)
 
     # ---------------- Timeline ---------------- #
 
-    def _poll_position(self):
-        if self.mpv:
-            pos = self.mpv.time_pos
-            if pos is not None:
-                self.position_changed.emit(int(pos * 1000))
+    def _frame_interval(self):
+        screen = self.screen()
+        rate = screen.refreshRate() if screen else 0
+        return max(1, int(1000 / rate)) if rate > 0 else 16
+
+    def _schedule_position(self):
+        # Coalesce every observer update within one display frame into a single delivery
+        if not self.position_tick.isActive():
+            self.position_tick.start(self._frame_interval())
+
+    def _deliver_position(self):
+        self._pos_pending = False
+        self.position_changed.emit(self._pos_ms)
+
+    def _cancel_position(self):
+        # Drop a pending delivery; the flag must go with it or the observer never schedules one again
+        self.position_tick.stop()
+        self._pos_pending = False
 
     def pos(self):
-        if self.mpv and self.mpv.time_pos:
-            return int(self.mpv.time_pos * 1000)
-        return 0
+        # Last position the observer reported, no property read
+        return self._pos_ms
+
+    def clock(self):
+        """Playback position in seconds for A/V sync, or None before the first time-pos.
+
+        time-pos only changes when a frame is shown, so between frames it is up to a frame
+        old; this runs it on from the moment it changed.
+        """
+        pos, changed = self._pos_sample
+        if pos is None or not self._is_playing:
+            return pos
+        return pos + min(time.perf_counter() - changed, CLOCK_MAX_EXTRAPOLATION)
 
     def dur(self):
         return self._duration
@@ -399,137 +595,1353 @@ class VideoPlayer(QOpenGLWidget):
     def set_pos(self, ms):
         if self.mpv:
             self.mpv.seek(ms / 1000, reference="absolute")
+            self._pos_ms = int(ms)
+            self._pos_sample = (ms / 1000, time.perf_counter())
+
+    # ---------------- Live scrubbing ---------------- #
+
+    def scrub_to(self, ms):
+        """Seek while the timeline is dragged: keyframe-fast, latest target wins.
+
+        Only one seek is in flight; targets arriving meanwhile overwrite each other and the newest
+        is sent once mpv reports playback-restart. The exact seek happens on release.
+        """
+        if not self.mpv:
+            return
+        self.scrub_requests += 1
+        with self._scrub_lock:
+            # A seek that never reported back (shouldn't happen) doesn't block scrubbing for good
+            if self._scrub_in_flight and time.monotonic() - self._scrub_started < 0.5:
+                self._scrub_target = ms
+                return
+            self._scrub_in_flight = True
+            self._scrub_started = time.monotonic()
+        self._send_scrub_seek(ms)
+
+    def _send_scrub_seek(self, ms):
+        self.scrub_seeks += 1
+        try:
+            self.mpv.seek(ms / 1000, reference="absolute", precision="keyframes")
+        except Exception:
+            with self._scrub_lock:
+                self._scrub_in_flight = False
+
+    def _on_playback_restart(self):
+        # mpv's event thread: the previous seek landed, send the newest target if there is one
+        with self._scrub_lock:
+            target = self._scrub_target
+            self._scrub_target = None
+            if target is None:
+                self._scrub_in_flight = False
+                return
+            self._scrub_started = time.monotonic()
+        self._send_scrub_seek(target)
+
+    def end_scrub(self):
+        # Drop the queued target, the exact seek on release replaces it
+        with self._scrub_lock:
+            self._scrub_target = None
 
     # ---------------- Cleanup ---------------- #
 
     def close(self):
-        self.position_timer.stop()
+        self._cancel_position()
         if self.mpv:
             try:
                 self.mpv.terminate()
             except Exception:
                 pass
 
+class VideoPlayer(VideoPlayerBase, QOpenGLWidget):
+    """Renders through libmpv's OpenGL render API"""
+    # mpv couldn't create its OpenGL render context (broken driver); the widget stays black
+    render_failed = pyqtSignal()
+
+    # ---------------- OpenGL / mpv ---------------- #
+
+    def initializeGL(self):
+        # Ensure context is current (CRITICAL on Wayland)
+        self.makeCurrent()
+
+        self.attach_mpv(self.create_mpv("auto-safe"))
+
+        # -------- SAFE proc address wrapper -------- #
+        # Create a proper ctypes callback function
+        @MpvGlGetProcAddressFn
+        def get_proc_address(_, name):
+            # Keep name as bytes - Qt expects bytes
+            if not isinstance(name, bytes):
+                name = name.encode('utf-8')
+            addr = self.context().getProcAddress(name)
+            if addr is None:
+                return 0  # MUST return 0, not None
+            return int(addr)
+
+        try:
+            self.ctx = MpvRenderContext(
+                self.mpv,
+                api_type="opengl",
+                opengl_init_params={
+                    "get_proc_address": get_proc_address
+                }
+            )
+        except Exception as e:
+            # Qt created the context fine but mpv can't render with it
+            print(f"OpenGL render context failed: {e}")
+            self.mpv.terminate()
+            self.mpv = None
+            self.render_failed.emit()
+            return
+
+        # Set update callback to trigger repaints
+        self.ctx.update_cb = self.on_mpv_update
+
+    def render_ready(self):
+        return self.isValid()
+
+    def paintGL(self):
+        if not self.ctx:
+            return
+
+        start = self._begin_frame()
+
+        # Get the actual framebuffer size (important for high DPI displays)
+        ratio = self.devicePixelRatioF()
+        w = int(self.width() * ratio)
+        h = int(self.height() * ratio)
+
+        self.ctx.render(
+            flip_y=True,
+            opengl_fbo={
+                "fbo": self.defaultFramebufferObject(),
+                "w": w,
+                "h": h,
+            },
+        )
+        self._end_frame(start)
+
+    def resizeGL(self, w, h):
+        """Handle widget resize events"""
+        if self.ctx:
+            self.update()
+
+    def close(self):
+        # libmpv needs the render context freed, with its GL context current, before the core goes
+        if self.ctx:
+            self.makeCurrent()
+            self.ctx.free()
+            self.ctx = None
+            self.doneCurrent()
+        super().close()
+
+# libmpv render.h parameter ids for the software render API, python-mpv has no names for these
+MPV_RENDER_PARAM_SW_SIZE = 17
+MPV_RENDER_PARAM_SW_FORMAT = 18
+MPV_RENDER_PARAM_SW_STRIDE = 19
+MPV_RENDER_PARAM_SW_POINTER = 20
+
+class SoftwareVideoPlayer(VideoPlayerBase, QWidget):
+    """Renders through libmpv's software render API, for machines without usable OpenGL.
+
+    mpv draws each frame into one preallocated QImage (reallocated only when the widget is
+    resized), which is then painted with QPainter.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self._frame = None
+
+        # The render parameter array is built once; only the size, stride and pointer change
+        self._sw_size = (ctypes.c_int * 2)()
+        self._sw_format = ctypes.c_char_p(b"rgb0")  # byte order of QImage.Format_RGBX8888
+        self._sw_stride = ctypes.c_size_t()
+        self._sw_params = (mpv.MpvRenderParam * 5)()  # zeroed, the last entry ends the list
+        for param, type_id, data in (
+            (self._sw_params[0], MPV_RENDER_PARAM_SW_SIZE, ctypes.addressof(self._sw_size)),
+            (self._sw_params[1], MPV_RENDER_PARAM_SW_FORMAT, ctypes.cast(self._sw_format, ctypes.c_void_p).value),
+            (self._sw_params[2], MPV_RENDER_PARAM_SW_STRIDE, ctypes.addressof(self._sw_stride)),
+            (self._sw_params[3], MPV_RENDER_PARAM_SW_POINTER, None),
+        ):
+            param.type_id = type_id
+            param.data = data
+
+    # ---------------- Software rendering ---------------- #
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Created on first show, like the OpenGL widget's initializeGL
+        if self.mpv is None:
+            self.attach_mpv(self.create_mpv("auto-copy-safe"))
+            try:
+                self.ctx = MpvRenderContext(self.mpv, api_type="sw")
+            except Exception as e:
+                # Playback (and the audio tracks) still work, the video area just stays black
+                print(f"Software render context failed: {e}")
+                from PyQt6.QtWidgets import QMessageBox
+                message = f"Could not start video rendering:\n{e}"
+                # Not from inside showEvent: the dialog runs its own event loop
+                QTimer.singleShot(0, lambda: QMessageBox.critical(self, "Video Error", message))
+                return
+            self.ctx.update_cb = self.on_mpv_update
+
+    def render_into(self, image):
+        """Have mpv draw the current frame into `image` (Format_RGBX8888)"""
+        self._sw_size[0] = image.width()
+        self._sw_size[1] = image.height()
+        self._sw_stride.value = image.bytesPerLine()
+        # bits() can only move if the image was shared and detached, but it costs nothing to re-read
+        self._sw_params[3].data = int(image.bits())
+        mpv._mpv_render_context_render(self.ctx.handle, self._sw_params)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if not self.ctx:
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
+            return
+
+        start = self._begin_frame()
+
+        # Render at the physical pixel size (important for high DPI displays)
+        ratio = self.devicePixelRatioF()
+        w = max(1, int(self.width() * ratio))
+        h = max(1, int(self.height() * ratio))
+        if self._frame is None or self._frame.width() != w or self._frame.height() != h:
+            self._frame = QImage(w, h, QImage.Format.Format_RGBX8888)
+            self._frame.setDevicePixelRatio(ratio)
+
+        self.render_into(self._frame)
+        painter.drawImage(0, 0, self._frame)
+        painter.end()
+        self._end_frame(start)
+
+    def close(self):
+        if self.ctx:
+            self.ctx.free()
+            self.ctx = None
+        super().close()
+
+def opengl_available():
+    """Whether an OpenGL context can be created at all (broken drivers fail here)"""
+    surface = QOffscreenSurface()
+    surface.create()
+    context = QOpenGLContext()
+    available = context.create() and context.makeCurrent(surface)
+    if available:
+        context.doneCurrent()
+    surface.destroy()
+    return available
+
+def create_video_player(renderer="auto", parent=None):
+    """VideoPlayer, or SoftwareVideoPlayer for renderer "software" or when "auto" finds no OpenGL.
+
+    A VideoPlayer whose mpv render context fails later emits render_failed; the window then
+    replaces it with a SoftwareVideoPlayer.
+    """
+    if renderer == "software" or (renderer == "auto" and not opengl_available()):
+        return SoftwareVideoPlayer(parent)
+    return VideoPlayer(parent)
+
+# ------------------------------ Offscreen Rendering ------------------------------ #
+class OffscreenRenderer:
+    """Renders mpv's OpenGL output into an FBO on a QOffscreenSurface, so no window or GPU is
+    needed (Mesa llvmpipe works). Frames are rendered as fast as mpv produces them: timing is
+    off (untimed) and audio is disabled, since mpv would otherwise pace video against the
+    null audio output's clock.
+
+    Needs a QGuiApplication. Headless tools use it to measure decode + render throughput.
+    """
+
+    def __init__(self, width=1920, height=1080, **mpv_options):
+        self.width = width
+        self.height = height
+
+        self.surface = QOffscreenSurface()
+        self.surface.setFormat(QSurfaceFormat.defaultFormat())
+        self.surface.create()
+        self.gl = QOpenGLContext()
+        self.gl.setFormat(self.surface.format())
+        if not self.gl.create() or not self.gl.makeCurrent(self.surface):
+            raise RuntimeError("Could not create an OpenGL context for offscreen rendering")
+        self.fbo = QOpenGLFramebufferObject(width, height)
+        self._gl_finish = ctypes.CFUNCTYPE(None)(int(self.gl.getProcAddress(b"glFinish")))
+
+        options = {
+            "vo": "libmpv",
+            "ao": "null",
+            "audio": "no",
+            "untimed": True,
+            "hwdec": "no",
+            "idle": True,
+            "ytdl": False,
+            "input_default_bindings": False,
+        }
+        options.update(mpv_options)
+        self.mpv = mpv.MPV(**options)
+
+        @MpvGlGetProcAddressFn
+        def get_proc_address(_, name):
+            addr = self.gl.getProcAddress(name)
+            if addr is None:
+                return 0
+            return int(addr)
+
+        # Keep a reference, mpv calls it for as long as the render context lives
+        self._get_proc_address = get_proc_address
+        self.ctx = MpvRenderContext(
+            self.mpv,
+            api_type="opengl",
+            opengl_init_params={"get_proc_address": get_proc_address},
+        )
+        self._frame_ready = threading.Event()
+        self.ctx.update_cb = self._frame_ready.set
+
+    def render_frame(self):
+        """Render the current frame into the FBO and wait for the GL work to finish"""
+        self.ctx.render(
+            flip_y=False,
+            opengl_fbo={"fbo": self.fbo.handle(), "w": self.width, "h": self.height},
+        )
+        self._gl_finish()
+        self.ctx.report_swap()
+
+    def run(self, file_path, max_frames=None, timeout=300.0):
+        """Play `file_path` to the end (or `max_frames`) rendering every frame.
+
+        Returns {"frames", "seconds", "fps", "render_ms": {p50, p95, max}}.
+        """
+        ended = threading.Event()
+
+        @self.mpv.event_callback("end-file")
+        def on_end(event):
+            ended.set()
+
+        render_times = []
+        self.mpv.loadfile(file_path)
+        start = time.perf_counter()
+        deadline = start + timeout
+        while not ended.is_set() and time.perf_counter() < deadline:
+            if max_frames is not None and len(render_times) >= max_frames:
+                break
+            if not self._frame_ready.wait(0.1):
+                continue
+            self._frame_ready.clear()
+            if self.ctx.update():
+                t = time.perf_counter()
+                self.render_frame()
+                render_times.append((time.perf_counter() - t) * 1000)
+        seconds = time.perf_counter() - start
+        on_end.unregister_mpv_events()
+        self.mpv.command("stop")
+
+        return {
+            "frames": len(render_times),
+            "seconds": seconds,
+            "fps": len(render_times) / seconds if seconds else 0.0,
+            "render_ms": {
+                "p50": _percentile(render_times, 50),
+                "p95": _percentile(render_times, 95),
+                "max": max(render_times, default=0.0),
+            },
+        }
+
+    def grab(self):
+        """The last rendered frame as a QImage"""
+        return self.fbo.toImage()
+
+    def close(self):
+        self.gl.makeCurrent(self.surface)
+        self.ctx.free()
+        self.mpv.terminate()
+        self.fbo = None
+        self.gl.doneCurrent()
+        self.surface.destroy()
+
+# ------------------------------ Media Probe ------------------------------ #
+def _float_or_none(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+class MediaInfo:
+    """Everything one probe pass knows about a file, shared by the whole load instead of re-probing.
+
+    `audio_streams` holds one dict per audio stream in stream order (index, codec, channels,
+    channel_layout, sample_rate, duration, start_time, language); `video` is the first video
+    stream (codec, width, height, duration, start_time) or None.
+    """
+
+    def __init__(self, path, size=0, mtime_ns=0, duration=None, start_time=None, audio_streams=None, video=None):
+        self.path = os.path.abspath(path)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.duration = duration      # seconds, from the container
+        self.start_time = start_time
+        self.audio_streams = audio_streams or []
+        self.video = video
+
+    @classmethod
+    def from_ffprobe(cls, path, data, st=None):
+        """Build from `ffprobe -show_streams -show_format -of json` output"""
+        st = st or os.stat(path)
+        fmt = data.get("format", {})
+        audio_streams = []
+        video = None
+        for stream in data.get("streams", []):
+            kind = stream.get("codec_type")
+            if kind == "audio":
+                audio_streams.append({
+                    "index": stream.get("index"),
+                    "codec": stream.get("codec_name"),
+                    "channels": stream.get("channels"),
+                    "channel_layout": stream.get("channel_layout"),
+                    "sample_rate": int(stream.get("sample_rate") or 0) or None,
+                    "duration": _float_or_none(stream.get("duration")),
+                    "start_time": _float_or_none(stream.get("start_time")),
+                    "language": stream.get("tags", {}).get("language"),
+                })
+            elif kind == "video" and video is None and not stream.get("disposition", {}).get("attached_pic"):
+                video = {
+                    "codec": stream.get("codec_name"),
+                    "width": stream.get("width"),
+                    "height": stream.get("height"),
+                    "duration": _float_or_none(stream.get("duration")),
+                    "start_time": _float_or_none(stream.get("start_time")),
+                }
+        return cls(
+            path,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            duration=_float_or_none(fmt.get("duration")),
+            start_time=_float_or_none(fmt.get("start_time")),
+            audio_streams=audio_streams,
+            video=video,
+        )
+
+    def to_dict(self):
+        return {
+            "path": self.path,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "duration": self.duration,
+            "start_time": self.start_time,
+            "audio_streams": self.audio_streams,
+            "video": self.video,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def matches(self, file_path):
+        """True if this still describes `file_path` (same path, size and modification time)"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return (os.path.abspath(file_path) == self.path
+                and st.st_size == self.size and st.st_mtime_ns == self.mtime_ns)
+
+    @property
+    def audio_count(self):
+        return len(self.audio_streams)
+
+    @property
+    def has_video(self):
+        return self.video is not None
+
+    @property
+    def resolution(self):
+        """(width, height) of the video stream, or None"""
+        if self.video and self.video.get("width") and self.video.get("height"):
+            return int(self.video["width"]), int(self.video["height"])
+        return None
+
+def probe_with_mpv(player, file_path, timeout=5.0):
+    """Open `file_path` paused in an existing mpv instance and build a MediaInfo from its track-list.
+
+    libmpv's demuxer does the probing in-process, so nothing is forked. Per-stream durations and
+    start times aren't exposed there and are left as None. Returns None if the file doesn't load
+    within `timeout` seconds or shows no streams at all; callers fall back to ffprobe.
+    """
+    def loaded_or_failed(event):
+        # Replacing the previous file ends it with reason "stop" first, only an error ends this wait
+        if event.event_id.value == mpv.MpvEventID.END_FILE:
+            return event.data.reason == mpv.MpvEventEndFile.ERROR
+        return True
+
+    st = os.stat(file_path)
+    player.pause = True
+    try:
+        with player.prepare_and_wait_for_event("file-loaded", "end-file", cond=loaded_or_failed, timeout=timeout):
+            player.loadfile(file_path)
+        # Failed to open, or another loadfile replaced it meanwhile
+        if player.path != file_path:
+            return None
+        tracks = player.track_list or []
+        if not tracks:
+            return None
+        duration = player.duration
+        start_time = player.demuxer_start_time
+        video_params = player.video_params or {}
+    except Exception as e:
+        print(f"Error probing media with mpv: {e}")
+        return None
+
+    audio_streams = []
+    video = None
+    for track in tracks:
+        if track.get("external"):
+            continue
+        if track.get("type") == "audio":
+            audio_streams.append({
+                "index": track.get("ff-index"),
+                "codec": track.get("codec"),
+                "channels": track.get("demux-channel-count"),
+                "channel_layout": track.get("demux-channels"),
+                "sample_rate": track.get("demux-samplerate"),
+                "duration": None,
+                "start_time": None,
+                "language": track.get("lang"),
+            })
+        elif track.get("type") == "video" and video is None and not track.get("albumart"):
+            video = {
+                "codec": track.get("codec"),
+                # video-params is only there once a frame has been decoded, the demuxer size always is
+                "width": video_params.get("w") or track.get("demux-w"),
+                "height": video_params.get("h") or track.get("demux-h"),
+                "duration": None,
+                "start_time": None,
+            }
+    if not audio_streams and video is None:
+        return None
+    return MediaInfo(
+        file_path,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        duration=duration,
+        start_time=start_time,
+        audio_streams=audio_streams,
+        video=video,
+    )
+
+class ProbeDatabase:
+    """MediaInfo results stored in SQLite between runs, keyed by (path, size, mtime).
+
+    A file that changed on disk gets a new key, and storing it drops the old row for that path.
+    Past `max_rows` the least recently used rows are dropped.
+    """
+
+    def __init__(self, db_path, max_rows):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        # Shared by the GUI and the load workers, so one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                "path TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "info TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS probes_key ON probes (path, size, mtime_ns)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS probes_last_used ON probes (last_used)")
+
+    def get(self, file_path):
+        """Stored MediaInfo for the file as it is on disk now, or None"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT info FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?", key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE probes SET last_used = ? WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (time.time(),) + key,
+                )
+        try:
+            return MediaInfo.from_dict(json.loads(row[0]))
+        except Exception:
+            return None
+
+    def put(self, info):
+        with self._lock, self._conn:
+            # Older versions of the same file are never looked up again
+            self._conn.execute("DELETE FROM probes WHERE path = ?", (info.path,))
+            self._conn.execute(
+                "INSERT INTO probes (path, size, mtime_ns, info, last_used) VALUES (?, ?, ?, ?, ?)",
+                (info.path, info.size, info.mtime_ns, json.dumps(info.to_dict()), time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM probes WHERE rowid IN "
+                "(SELECT rowid FROM probes ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 # ------------------------------ Audio Manager (supports N tracks) ------------------------------ #
+# Gain applied to every track at playback time
+TRACK_GAIN = 4.0
+
+# --af label of the mixer engine's mix stage, the target of its af-command volume changes
+MIXER_AF_LABEL = "crustymix"
+
+# Intermediate formats for extracted tracks: name -> (ffmpeg audio codec, file suffix)
+EXTRACT_FORMATS = {
+    "wav": ("pcm_s16le", ".wav"),   # 16-bit PCM, ~10 MB per track-minute
+    "flac": ("flac", ".flac"),      # lossless, roughly half the size of WAV
+    "f32": ("pcm_f32le", ".wav"),   # float32 PCM, headroom above 0 dBFS and plain samples after the header
+    "copy": ("copy", ".mka"),       # the source stream as-is in Matroska, no decode at all
+}
+
+def physical_core_count():
+    """Count physical CPU cores (hyperthread siblings share a core), falling back to the logical count"""
+    cores = set()
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            physical_id = None
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    cores.add((physical_id, value.strip()))
+    except Exception:
+        pass
+    return len(cores) or os.cpu_count() or 1
+
+# Every extraction job demuxes the whole source, so the automatic worker count keeps the number
+# of jobs low: at least STREAMS_PER_JOB streams share a demux, and never more than
+# MAX_DEFAULT_EXTRACT_WORKERS source reads run at once
+STREAMS_PER_JOB = 2
+MAX_DEFAULT_EXTRACT_WORKERS = 4
+
+def default_extract_workers(stream_count):
+    """Jobs to split `stream_count` streams into when extract_workers is 0"""
+    return max(1, min(MAX_DEFAULT_EXTRACT_WORKERS, physical_core_count(), stream_count // STREAMS_PER_JOB))
+
+class ExtractionJob:
+    """One single-pass ffmpeg run writing a group of audio streams, tracking how far it has got"""
+
+    def __init__(self, cmd, outputs, generation=0):
+        self.cmd = cmd
+        self.outputs = outputs  # list of (stream_index, path)
+        self.generation = generation  # load this job belongs to
+        self.extracted = 0.0    # seconds of audio written so far
+        self.returncode = None
+        self.proc = None
+        self.cancelled = False
+        self.done = threading.Event()
+
+    def run(self, register=None):
+        try:
+            if self.cancelled:
+                # stopped while still queued in the pool
+                self.returncode = -1
+                return self.returncode
+            proc = self.proc = subprocess.Popen(
+                self.cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            if register:
+                register(proc)
+            if self.cancelled:
+                # stop() ran between the check above and Popen
+                proc.terminate()
+            # -progress pipe:1 writes key=value lines; out_time_us is how much has been written
+            for line in proc.stdout:
+                key, _, value = line.strip().partition("=")
+                if key == "out_time_us" and value.isdigit():
+                    self.extracted = int(value) / 1_000_000
+            self.returncode = proc.wait()
+            return self.returncode
+        finally:
+            self.done.set()
+
+    def stop(self):
+        self.cancelled = True
+        if self.proc and self.proc.poll() is None:
+            try:
+                self.proc.terminate()
+            except Exception:
+                pass
+
+class ExtractionCache:
+    """Extracted tracks kept on disk between runs, keyed by source (path, size, mtime), stream and format.
+
+    Files are evicted least-recently-used first once the cache grows past its byte budget.
+    """
+
+    def __init__(self, directory, budget_bytes):
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.pinned = set()  # files in use by the current players, never evicted
+        self._lock = threading.Lock()
+
+    def path_for(self, file_path: str, stream_index: int, output_format: str, suffix: str):
+        st = os.stat(file_path)
+        key = json.dumps([os.path.abspath(file_path), st.st_size, st.st_mtime_ns, stream_index, output_format])
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + suffix)
+
+    def part_path(self, path: str):
+        # Written next to the final file and renamed into place once complete
+        stem, suffix = os.path.splitext(path)
+        return f"{stem}.part{suffix}"
+
+    def lookup(self, path: str):
+        """Return True (and mark the entry recently used) if `path` is already cached"""
+        with self._lock:
+            if os.path.exists(path):
+                self.hits += 1
+                try:
+                    os.utime(path)  # mtime doubles as the LRU timestamp
+                except Exception:
+                    pass
+                return True
+            self.misses += 1
+            return False
+
+    def commit(self, part_path: str, keep_part: bool = False):
+        """Move a finished part file into place and evict down to the budget. Returns the final path.
+
+        With `keep_part` the entry is hard-linked instead, for a player that still has the part file open.
+        """
+        stem, suffix = os.path.splitext(part_path)
+        path = stem[:-len(".part")] + suffix
+        if keep_part:
+            if os.path.exists(path):
+                os.unlink(path)
+            os.link(part_path, path)
+        else:
+            os.replace(part_path, path)
+        self.evict()
+        return path
+
+    def evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if path in self.pinned:
+                    continue
+                try:
+                    st = os.stat(path)
+                except Exception:
+                    continue
+                if ".part." in name:
+                    # Left over from a run that never finished (crash, kill)
+                    if time.time() - st.st_mtime > 24 * 60 * 60:
+                        try:
+                            os.unlink(path)
+                        except Exception:
+                            pass
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.budget_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                except Exception:
+                    pass
+
+    def stats(self):
+        total = 0
+        files = 0
+        for name in os.listdir(self.directory):
+            if ".part." not in name:
+                try:
+                    total += os.path.getsize(os.path.join(self.directory, name))
+                    files += 1
+                except Exception:
+                    pass
+        return {"hits": self.hits, "misses": self.misses, "files": files, "bytes": total}
+
 class AudioManager(QObject):
     audio_tracks_detected = pyqtSignal(int)
+    # (track_index, output_path) emitted as each track finishes extracting
+    track_extracted = pyqtSignal(int, str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         super().__init__(parent)
 
+        if settings is None:
+            settings = load_settings()
+        self.settings = settings
+
         # dynamic lists for arbitrary number of tracks
         self.audio_players = []   # list of mpv.MPV instances
         self.temp_files = []
         self.ffmpeg_subprocesses = []
 
         self.ffprobe = "ffprobe"
+        self.media_info = None  # MediaInfo of the last probed file, reused until the file changes
+        self.mpv_probe = None   # callable(path) -> MediaInfo or None, e.g. VideoPlayer.probe; ffprobe is the fallback
+
+        # Extra mpv options for every audio player (e.g. ao="null" for headless benchmarks)
+        self.player_options = {}
+
+        # Mixer mode: the video player's mpv instance mixes every track itself through lavfi-complex
+        self.mixer = None         # mpv.MPV that plays the video, set by MainWindow
+        self.mixer_gains = []     # per-track volume filter gains
+        # Fallback for mpv without af-command targets: a slider drag rebuilds the mix stage once
+        self.mixer_timer = QTimer(self)
+        self.mixer_timer.setSingleShot(True)
+        self.mixer_timer.setInterval(150)
+        self.mixer_timer.timeout.connect(self.apply_mix_stage)
+
+        # Upper bound on concurrent ffmpeg extractions (0 = default_extract_workers for the load)
+        self.max_workers = int(settings.get("extract_workers", 0))
+
+        # Jobs still writing while progressive playback runs ahead of them
+        self.extraction_jobs = []
+        self.part_files = []  # cache part files progressive players are still reading
+
+        # Load-generation token: cancel_load() bumps it, and anything a load started under an
+        # older generation (players, extracted files, signals) is thrown away instead of used
+        self.generation = 0
+        self.active_jobs = set()  # every ExtractionJob not yet finished, whatever load it belongs to
+        self._load_lock = threading.Lock()
+
+        budget_mb = settings.get("cache_budget_mb", 2048)
+        self.cache = ExtractionCache(os.path.join(CACHE_DIR, "audio"), budget_mb * 1024 * 1024) if budget_mb else None
+
+        probe_rows = settings.get("probe_db_max_rows", 20000)
+        self.probe_db = None
+        if probe_rows:
+            try:
+                self.probe_db = ProbeDatabase(os.path.join(CACHE_DIR, "probe.sqlite3"), probe_rows)
+            except Exception as e:
+                print(f"Error opening probe database: {e}")
 
     def cleanup_temp_files(self):
-        # stop players first
-        for p in self.audio_players:
+        # drop the mixer graph so the next file starts from plain playback
+        if self.mixer_gains:
+            self.mixer_timer.stop()
+            self.mixer_gains = []
+            try:
+                self.mixer["lavfi-complex"] = ""
+                self.mixer.af = ""
+            except Exception:
+                pass
+        # stop extractions still feeding the players (progressive playback)
+        for job in self.extraction_jobs:
+            job.stop()
+        self.extraction_jobs = []
+        # stop players first, then remove their files
+        self._discard(self.audio_players, self.temp_files, self.part_files)
+        self.temp_files = []
+        self.part_files = []
+        if self.cache:
+            self.cache.pinned = set()
+        # clear players
+        self.audio_players = []
+
+    def _discard(self, players, temp_files, part_files):
+        for p in players:
             try:
                 p.terminate()
             except Exception:
                 pass
-        # remove temporary files
-        for f in self.temp_files:
+        # remove temporary files (cached tracks stay for next time)
+        for f in temp_files:
+            if self.cache and os.path.dirname(f) == self.cache.directory:
+                continue
+            try:
+                os.unlink(f)
+            except Exception:
+                pass
+        for f in part_files:
             try:
                 os.unlink(f)
             except Exception:
                 pass
-        self.temp_files = []
-        # clear players
-        self.audio_players = []
 
-    def detect_audio_tracks(self, file_path: str) -> int:
-        # Use ffprobe to detect number of audio streams
+    def cancel_load(self):
+        """Preempt the load in progress: kill its ffmpeg/ffprobe children and invalidate its results.
+
+        Returns the new generation token for the load that replaces it.
+        """
+        with self._load_lock:
+            self.generation += 1
+            jobs = list(self.active_jobs)
+            processes = list(self.ffmpeg_subprocesses)
+        # A stopped job fails, and failed jobs delete their partial outputs
+        for job in jobs:
+            job.stop()
+        for proc in processes:
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+        self.reap_processes()
+        return self.generation
+
+    def is_current(self, generation):
+        return generation == self.generation
+
+    def register_process(self, proc):
+        with self._load_lock:
+            self.ffmpeg_subprocesses.append(proc)
+
+    def reap_processes(self):
+        """Forget child processes that have exited (poll() also reaps them) so long sessions don't pile up handles"""
+        with self._load_lock:
+            self.ffmpeg_subprocesses[:] = [p for p in self.ffmpeg_subprocesses if p.poll() is None]
+
+    def run_tool(self, cmd):
+        """Run ffprobe/ffmpeg to completion as a registered (and so cancellable) child. Returns its stdout."""
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self.register_process(proc)
+        try:
+            stdout, _ = proc.communicate()
+        finally:
+            self.reap_processes()
+        return stdout
+
+    def _install(self, generation, players, temp_files=(), part_files=()):
+        """Swap in the players of a finished load, or throw them away if a newer load has started"""
+        with self._load_lock:
+            if generation == self.generation:
+                self.cleanup_temp_files()
+                self.audio_players = list(players)
+                self.temp_files = list(temp_files)
+                self.part_files = list(part_files)
+                self.extraction_jobs = [job for job in self.active_jobs if job.generation == generation]
+                if self.cache:
+                    self.cache.pinned = set(temp_files) | set(part_files)
+                return True
+        self._discard(players, temp_files, part_files)
+        return False
+
+    def probe_media(self, file_path: str, use_mpv: bool = True, generation: int = None):
+        """One probe pass over streams and format, reused for the rest of the load. Returns a MediaInfo or None.
+
+        Files probed in an earlier run come from the probe database without spawning anything. New files
+        are read through `mpv_probe` when the mpv backend is selected, and through ffprobe otherwise or
+        if that fails. `use_mpv=False` keeps the video player from (re)loading the file.
+        """
+        if self.media_info is not None and self.media_info.matches(file_path):
+            return self.media_info
+        if self.probe_db:
+            info = self.probe_db.get(file_path)
+            if info is not None:
+                self.media_info = info
+                return info
+        info = None
+        if use_mpv and self.mpv_probe and self.settings.get("probe_backend", "mpv") == "mpv":
+            info = self.mpv_probe(file_path)
+        if info is None and (generation is None or self.is_current(generation)):
+            info = self.ffprobe_media(file_path)
+        if info is None:
+            return None
+        self.media_info = info
+        self._store_probe(info)
+        return info
+
+    def probe_file(self, file_path: str, run=None):
+        """Probe database or ffprobe, leaving the current load's media_info and the video player alone.
+
+        Used for scanning many files; `run` replaces run_tool so the caller can cancel its own processes.
+        """
+        info = self.probe_db.get(file_path) if self.probe_db else None
+        if info is None:
+            info = self.ffprobe_media(file_path, run)
+            if info is not None:
+                self._store_probe(info)
+        return info
+
+    def _store_probe(self, info):
+        if self.probe_db:
+            try:
+                self.probe_db.put(info)
+            except Exception as e:
+                print(f"Error saving probe result: {e}")
+
+    def ffprobe_media(self, file_path: str, run=None):
         try:
             cmd = [
                 "ffprobe",
                 "-v",
                 "error",
-                "-select_streams",
-                "a",
-                "-show_entries",
-                "stream=index",
+                "-show_streams",
+                "-show_format",
                 "-of",
                 "json",
                 file_path,
             ]
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            probe_data = json.loads(result.stdout) if result.stdout else {}
-            streams = probe_data.get("streams", [])
-            num = len(streams)
+            stdout = (run or self.run_tool)(cmd)
+            data = json.loads(stdout) if stdout else {}
+            if "format" not in data:
+                return None  # not a media file ffprobe can read
+            info = MediaInfo.from_ffprobe(file_path, data)
+        except Exception as e:
+            print(f"Error probing media: {e}")
+            return None
+        return info
+
+    def detect_audio_tracks(self, file_path: str, generation: int = None) -> int:
+        # Number of audio streams, from the shared probe
+        if generation is None:
+            generation = self.generation
+        info = self.probe_media(file_path, generation=generation)
+        num = info.audio_count if info else 0
+        if self.is_current(generation):
             self.audio_tracks_detected.emit(num)
-            return num
-        except Exception:
-            return 0
-
-    def extract_audio_tracks(self, file_path: str, max_tracks: int = None):
-        # Extract all audio tracks (or up to max_tracks if provided) to WAV temp files. Returns list of temp file paths.
-        self.cleanup_temp_files()
-        num_audio_tracks = self.detect_audio_tracks(file_path)
-        if num_audio_tracks == 0:
+        return num
+
+    def output_format(self, streaming: bool = False):
+        """(format key, file suffix) describing what build_extract_cmd writes, used to key the cache"""
+        name = self.settings.get("extract_format", "wav")
+        codec, suffix = EXTRACT_FORMATS.get(name, EXTRACT_FORMATS["wav"])
+        if streaming:
+            suffix = ".mka"
+        if codec == "copy":
+            return f"{codec}{suffix}", suffix
+        if self.settings.get("extract_passthrough", False):
+            return f"{codec}-native{suffix}", suffix
+        return f"{codec}-44100-2ch{suffix}", suffix
+
+    def build_extract_cmd(self, file_path: str, outputs, streaming: bool = False):
+        """Build a single ffmpeg command writing each (stream_index, path) pair to its own file"""
+        codec, _ = EXTRACT_FORMATS.get(self.settings.get("extract_format", "wav"), EXTRACT_FORMATS["wav"])
+        # Passthrough skips resampling/downmixing here; mpv converts once, at the audio output
+        convert = codec != "copy" and not self.settings.get("extract_passthrough", False)
+        cmd = ["ffmpeg", "-nostdin", "-nostats", "-progress", "pipe:1", "-i", file_path]
+        for stream_index, path in outputs:
+            # Per-output options must come right before the output path they apply to:
+            # audio stream N, converted to 2ch 44100Hz unless passed through or copied untouched.
+            # Gain is applied at playback so loud sources don't clip here.
+            cmd.extend(["-map", f"0:a:{stream_index}"])
+            if convert:
+                cmd.extend(["-ac", "2", "-ar", "44100"])
+            cmd.extend(["-c:a", codec])
+            if streaming:
+                # Matroska is readable while it grows; flush small clusters so players can follow
+                cmd.extend(["-flush_packets", "1", "-cluster_time_limit", "500"])
+            cmd.extend(["-y", path])
+        return cmd
+
+    def extract_streams(self, file_path: str, outputs, workers: int = None, head_start: float = None,
+                        finalize=None, generation: int = None):
+        """Extract (stream_index, path) pairs with a bounded pool of ffmpeg workers.
+
+        Streams are dealt round-robin into at most `workers` jobs, each one a single-pass ffmpeg
+        run that reads the whole source. Returns the successfully written paths in the same order as `outputs`.
+
+        With `head_start` (seconds) the outputs must be growable (.mka) and this returns as soon
+        as every job has written that much audio; the jobs keep running in `active_jobs`.
+        `finalize(path)` is called on every completed output and returns where the file ended up.
+        cancel_load() stops the jobs, which then count as failed.
+        """
+        if not outputs:
+            return []
+        if generation is None:
+            generation = self.generation
+
+        streaming = head_start is not None
+        workers = workers or self.max_workers or default_extract_workers(len(outputs))
+        workers = max(1, min(workers, len(outputs)))
+        jobs = [
+            ExtractionJob(self.build_extract_cmd(file_path, outputs[w::workers], streaming), outputs[w::workers],
+                          generation)
+            for w in range(workers)
+        ]
+        failed = set()
+
+        with self._load_lock:
+            if not self.is_current(generation):
+                return []
+            self.active_jobs.update(jobs)
+
+        def job_finished(job, future):
+            with self._load_lock:
+                self.active_jobs.discard(job)
+            self.reap_processes()
+            try:
+                if future.result() != 0:
+                    raise RuntimeError(f"ffmpeg exited with {job.returncode}")
+                done = [(stream_index, finalize(path) if finalize else path) for stream_index, path in job.outputs]
+            except Exception:
+                # extraction failed or was stopped, don't leave partial output files behind
+                for _, path in job.outputs:
+                    failed.add(path)
+                    try:
+                        os.unlink(path)
+                    except Exception:
+                        pass
+                return
+            if self.is_current(job.generation):
+                for stream_index, path in done:
+                    self.track_extracted.emit(stream_index, path)
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = {pool.submit(job.run, self.register_process): job for job in jobs}
+        pool.shutdown(wait=False)
+
+        if streaming:
+            for future, job in futures.items():
+                future.add_done_callback(partial(job_finished, job))
+            # Every job must be far enough ahead (or finished) before playback can start
+            while not all(job.done.is_set() or job.extracted >= head_start for job in jobs):
+                if not self.is_current(generation):
+                    break
+                time.sleep(0.05)
+        else:
+            for future in as_completed(futures):
+                job_finished(futures[future], future)
+
+        return [path for _, path in outputs if path not in failed]
+
+    def buffered_until(self):
+        """Seconds of audio available to every player, or None once extraction has finished"""
+        running = [job for job in self.extraction_jobs if not job.done.is_set()]
+        if not running:
+            return None
+        return min(job.extracted for job in running)
+
+    def extract_audio_tracks(self, file_path: str, max_tracks: int = None, generation: int = None):
+        # Extract all audio tracks (or up to max_tracks if provided) to temp files. Returns list of temp file paths.
+        # The previous file's players are replaced once the new ones are ready (see _install).
+        if generation is None:
+            generation = self.generation
+        num_audio_tracks = self.detect_audio_tracks(file_path, generation)
+        if num_audio_tracks == 0 or not self.is_current(generation):
             return []
 
         total_to_extract = num_audio_tracks if max_tracks is None else min(num_audio_tracks, max_tracks)
 
+        # Progressive playback starts the players on growing Matroska files after a short head start
+        streaming = self.settings.get("progressive_playback", False)
+        head_start = float(self.settings.get("playback_head_start", 5.0)) if streaming else None
+
+        format_key, suffix = self.output_format(streaming)
+
+        # Cached tracks are used as-is; the rest are extracted (into the cache when it's enabled)
+        final_paths = []
+        outputs = []
         for i in range(total_to_extract):
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            temp_file.close()
-            try:
-                # Use ffmpeg to extract audio stream i, convert to 2ch 44100Hz WAV and boost gain
-                cmd = [
-                    "ffmpeg",
-                    "-i", file_path,
-                    "-map", f"0:a:{i}",
-                    "-af", "volume=4.0",
-                    "-ac", "2",
-                    "-ar", "44100",
-                    "-y",
-                    temp_file.name
-                ]
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                self.ffmpeg_subprocesses.append(proc)
-                proc.wait()
-                self.temp_files.append(temp_file.name)
-            except Exception:
-                # stop if extraction fails for any stream
-                break
+            if self.cache:
+                path = self.cache.path_for(file_path, i, format_key, suffix)
+                if not self.cache.lookup(path):
+                    outputs.append((i, self.cache.part_path(path)))
+            else:
+                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+                temp_file.close()
+                path = temp_file.name
+                outputs.append((i, path))
+            final_paths.append(path)
+
+        part_files = []
+        if self.cache:
+            # Progressive players keep reading the part file, so it is linked into place rather than moved
+            self.cache.pinned |= set(final_paths) | {path for _, path in outputs}
+            finalize = partial(self.cache.commit, keep_part=streaming)
+            if streaming:
+                part_files = [path for _, path in outputs]
+        else:
+            finalize = None
+
+        written = set(self.extract_streams(file_path, outputs, head_start=head_start, finalize=finalize,
+                                           generation=generation))
+        written_by_track = {i: path for i, path in outputs if path in written}
+        extracted_tracks = {i for i, _ in outputs}
+
+        sources = []  # (final path, path the player opens)
+        for i, path in enumerate(final_paths):
+            if i not in extracted_tracks:
+                sources.append((path, path))  # cache hit
+            elif i in written_by_track:
+                # appending:// makes mpv wait for more data at the end of a still-growing file
+                sources.append((path, f"appending://{written_by_track[i]}" if streaming else path))
+        temp_files = [path for path, _ in sources]
+        if not self.is_current(generation):
+            # Preempted by a newer load: drop whatever was written rather than open players for it
+            self._discard([], [], [path for _, path in outputs])
+            return []
 
         # create MPV players dynamically for each extracted file
-        self.audio_players = []
+        players = []
 
-        for path in self.temp_files:
+        for _, source in sources:
             try:
-                player = mpv.MPV(
-                    video='no',
-                    input_default_bindings='no',
-                    input_vo_keyboard='no',
-                    osc='no',
-                    ytdl='no',
-                    volume_max=100,  # Max volume is 100 (slider 200% = MPV 100)
-                )
-                # Start at volume 50 (matches slider default of 100 = normal volume)
-                player.volume = 50
-                player.play(path)
-                player.pause = True
-                self.audio_players.append(player)
+                players.append(self._create_player(source))
             except Exception as e:
                 print(f"Error creating audio player: {e}")
                 pass
 
+        if not self._install(generation, players, temp_files, part_files):
+            return []
         return self.temp_files
 
+    def open_direct_tracks(self, file_path: str, max_tracks: int = None, generation: int = None):
+        """Play every audio track straight from the source file, one mpv instance per track, no extraction"""
+        if generation is None:
+            generation = self.generation
+        num_audio_tracks = self.detect_audio_tracks(file_path, generation)
+        total = num_audio_tracks if max_tracks is None else min(num_audio_tracks, max_tracks)
+
+        players = []
+        for i in range(total):
+            if not self.is_current(generation):
+                break
+            try:
+                # aid is 1-based
+                players.append(self._create_player(file_path, aid=i + 1))
+            except Exception as e:
+                print(f"Error creating audio player: {e}")
+                pass
+
+        if not self._install(generation, players):
+            return []
+        return self.audio_players
+
+    def open_mixer_tracks(self, file_path: str, max_tracks: int = None, generation: int = None):
+        """Mix every audio track inside the video player's mpv instance: one demuxer, one clock, no extra players"""
+        if generation is None:
+            generation = self.generation
+        if self.mixer is None:
+            self.cleanup_temp_files()
+            return 0
+        num_audio_tracks = self.detect_audio_tracks(file_path, generation)
+        total = num_audio_tracks if max_tracks is None else min(num_audio_tracks, max_tracks)
+
+        with self._load_lock:
+            if not self.is_current(generation):
+                return 0
+            self.cleanup_temp_files()
+            # Same starting level as a player at volume 50 (slider default of 100 = normal volume)
+            self.mixer_gains = [self.mixer_gain(0.5)] * total
+            if total:
+                # Undo VideoPlayer.set_video_muted from a previous file
+                self.mixer.mute = False
+                self.mixer.aid = "auto"
+                self.apply_mixer_graph()
+        return total
+
+    def mixer_gain(self, gain: float):
+        # mpv's volume property is cubic, so match a player at volume gain*100 plus the track gain
+        return TRACK_GAIN * gain ** 3
+
+    def build_mixer_graph(self):
+        """lavfi-complex graph merging every aid (as stereo) into one stream with 2 channels per track.
+
+        Video isn't part of it, mpv plays the video track as usual.
+        """
+        count = len(self.mixer_gains)
+        parts = [f"[aid{i + 1}]aformat=channel_layouts=stereo[s{i}]" for i in range(count)]
+        inputs = "".join(f"[s{i}]" for i in range(count))
+        parts.append(f"{inputs}amerge=inputs={count}[ao]")
+        return ";".join(parts)
+
+    def build_mix_stage(self):
+        """--af filter splitting the merged stream back into tracks, each through volume@tN, into amix.
+
+        mpv's af-command can reach filters in --af but not in lavfi-complex, so the gains live here.
+        """
+        count = len(self.mixer_gains)
+        tracks = [
+            f"pan=stereo|c0=c{2 * i}|c1=c{2 * i + 1},volume@t{i}={gain:.4f}" for i, gain in enumerate(self.mixer_gains)
+        ]
+        if count == 1:
+            graph = tracks[0]
+        else:
+            parts = ["asplit=" + str(count) + "".join(f"[in{i}]" for i in range(count))]
+            parts += [f"[in{i}]{track}[a{i}]" for i, track in enumerate(tracks)]
+            parts.append("".join(f"[a{i}]" for i in range(count)) + f"amix=inputs={count}:normalize=0")
+            graph = ";".join(parts)
+        # %n% quoting (n = byte length) because the graph itself contains [labels]
+        return f"@{MIXER_AF_LABEL}:lavfi=graph=%{len(graph.encode())}%{graph}"
+
+    def apply_mixer_graph(self):
+        # Built once per file; volume changes go to the mix stage without touching the graph
+        if self.mixer is not None and self.mixer_gains:
+            try:
+                self.mixer.af = self.build_mix_stage()
+                self.mixer["lavfi-complex"] = self.build_mixer_graph()
+            except Exception as e:
+                print(f"Error setting mixer graph: {e}")
+
+    def apply_mix_stage(self):
+        if self.mixer is not None and self.mixer_gains:
+            try:
+                self.mixer.af = self.build_mix_stage()
+            except Exception as e:
+                print(f"Error setting mixer gains: {e}")
+
+    def set_mixer_gain(self, index: int, gain: float):
+        self.mixer_gains[index] = gain
+        try:
+            self.mixer.command("af-command", MIXER_AF_LABEL, "volume", f"{gain:.4f}", f"volume@t{index}")
+        except Exception:
+            # mpv before 0.35 has no target argument; rebuild the (audio only) mix stage instead
+            self.mixer_timer.start()
+
+    def track_count(self):
+        return len(self.audio_players) or len(self.mixer_gains)
+
+    def open_audio_tracks(self, file_path: str, max_tracks: int = None, generation: int = None):
+        """Set up one player per audio track using the configured audio mode. Returns the number of tracks.
+
+        Returns 0 without touching the current players if `generation` was preempted meanwhile.
+        """
+        mode = self.settings.get("audio_mode", "extract")
+        if mode == "direct":
+            return len(self.open_direct_tracks(file_path, max_tracks, generation))
+        if mode == "mixer":
+            return self.open_mixer_tracks(file_path, max_tracks, generation)
+        return len(self.extract_audio_tracks(file_path, max_tracks, generation))
+
+    def _create_player(self, source: str, **options):
+        kwargs = dict(
+            video='no',
+            input_default_bindings='no',
+            input_vo_keyboard='no',
+            osc='no',
+            ytdl='no',
+            volume_max=100,  # Max volume is 100 (slider 200% = MPV 100)
+            af=f"lavfi=[volume={TRACK_GAIN}]",  # track gain, applied here rather than baked into the audio
+        )
+        kwargs.update(self.player_options)
+        kwargs.update(options)
+        player = mpv.MPV(**kwargs)
+        # Start at volume 50 (matches slider default of 100 = normal volume)
+        player.volume = 50
+        player.play(source)
+        player.pause = True
+        return player
+
     def set_audio_src(self):
         # Already set during extract. Keep for compatibility if needed.
         pass
@@ -569,7 +1981,9 @@ class AudioManager(QObject):
         #   0.0 = silent (MPV volume 0)
         #   0.5 = normal volume (MPV volume 50) 
         #   1.0 = +100% boost (MPV volume 100)
-        if 0 <= index < len(self.audio_players):
+        if 0 <= index < len(self.mixer_gains):
+            self.set_mixer_gain(index, self.mixer_gain(gain))
+        elif 0 <= index < len(self.audio_players):
             try:
                 player = self.audio_players[index]
                 
@@ -581,6 +1995,7 @@ class AudioManager(QObject):
                 print(f"Error setting volume for track {index}: {e}")
 
     def cleanup_on_close(self):
+        self.cancel_load()
         for p in self.ffmpeg_subprocesses:
             try:
                 p.terminate()
@@ -596,8 +2011,584 @@ class AudioManager(QObject):
         self.audio_players = []
         self.ffmpeg_subprocesses = []
 
+        if self.probe_db:
+            try:
+                self.probe_db.close()
+            except Exception:
+                pass
+            self.probe_db = None
+
+# ------------------------------ Audio Sync ------------------------------ #
+def _percentile(values, q):
+    """q-th percentile (0-100) of `values`, linearly interpolated"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = (len(ordered) - 1) * q / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+class SyncController:
+    """Keeps the audio players on the video player's clock by nudging their playback speed.
+
+    The video player is the master: it drives the timeline and the picture can't be slewed without
+    visible judder. Each audio player is a slave whose speed is set to 1 - gain * drift (clamped to
+    +/- max_correction), so it converges smoothly without the audible skip of a seek. Drift inside
+    the deadband is left alone, and only drift past the hard-seek threshold is fixed with a seek.
+    Corrections use the median of the last `sync_smoothing` samples, so single noisy reads don't
+    move the speed.
+
+    Every track's drift is kept in its own ring buffer of the last `sync_history` samples (see stats()).
+    """
+
+    def __init__(self, settings):
+        self.deadband = settings.get("sync_deadband_ms", 15) / 1000.0
+        self.gain = settings.get("sync_gain", 0.5)
+        self.max_correction = settings.get("sync_max_correction", 0.05)
+        self.hard_seek = settings.get("sync_hard_seek_ms", 1000) / 1000.0
+        self.history_size = settings.get("sync_history", 200)
+        self.smoothing = max(1, settings.get("sync_smoothing", 9))
+        self.clear()
+
+    def clear(self):
+        """Forget all tracks and their drift, for a new file (even one with the same track count)"""
+        self.hard_seeks = 0  # how often the smooth correction wasn't enough
+        self.history = []    # per track: deque of drift samples in ms (positive = audio ahead)
+        self.recent = []     # per track: drift samples (s) since the last seek, for the median
+        self.speeds = []     # per track: the speed last written to the player
+
+    def correction(self, drift):
+        """Playback speed for a slave that is `drift` seconds ahead (negative: behind) of the master"""
+        if abs(drift) <= self.deadband:
+            return 1.0
+        return 1.0 - max(-self.max_correction, min(self.max_correction, self.gain * drift))
+
+    def _resize(self, count):
+        # After clear(), or if tracks were added or removed
+        if len(self.history) != count:
+            self.history = [deque(maxlen=self.history_size) for _ in range(count)]
+            self.recent = [deque(maxlen=self.smoothing) for _ in range(count)]
+            self.speeds = [1.0] * count
+
+    def update(self, master_clock, players):
+        """Correct every player against `master_clock()`, the master position in seconds (or None)"""
+        self._resize(len(players))
+
+        # Sample every track in one pass, each against the master clock read right next to it
+        samples = []
+        for player in players:
+            try:
+                master_pos = master_clock()
+                pos = player.time_pos
+                samples.append(None if pos is None or master_pos is None else (pos - master_pos, master_pos))
+            except Exception:
+                samples.append(None)
+
+        for i, (player, sample) in enumerate(zip(players, samples)):
+            if sample is None:
+                continue
+            drift, master_pos = sample
+            self.history[i].append(drift * 1000.0)
+            self.recent[i].append(drift)
+            smoothed = _percentile(self.recent[i], 50)
+            try:
+                if abs(smoothed) > self.hard_seek:
+                    self.hard_seeks += 1
+                    player.seek(master_pos, reference="absolute")
+                    self.recent[i].clear()
+                    speed = 1.0
+                else:
+                    speed = self.correction(smoothed)
+                # Tracks that are in sync (and already at normal speed) are never touched
+                if speed != self.speeds[i]:
+                    player.speed = speed
+                    self.speeds[i] = speed
+            except Exception:
+                pass  # Ignore sync errors
+
+    def reset(self, players):
+        """Back to normal speed, e.g. after a pause or seek (the players are re-aligned by a seek anyway)"""
+        for i, player in enumerate(players):
+            if i < len(self.speeds) and self.speeds[i] == 1.0:
+                continue
+            try:
+                player.speed = 1.0
+            except Exception:
+                pass
+        self.speeds = [1.0] * len(self.speeds)
+        for recent in self.recent:
+            recent.clear()
+
+    def stats(self):
+        """Per track {min, mean, p95, max} drift in ms over the ring buffer (p95 of the absolute drift), or None"""
+        result = []
+        for samples in self.history:
+            if not samples:
+                result.append(None)
+                continue
+            result.append({
+                "min": min(samples),
+                "mean": sum(samples) / len(samples),
+                "p95": _percentile([abs(d) for d in samples], 95),
+                "max": max(samples),
+            })
+        return result
+
+class SeekBarrier:
+    """Group seek: seek several mpv players, wait until every one is ready, then unpause them together.
+
+    Seeking and resuming players one after another lets the first ones start playing while the last
+    ones are still seeking, so tracks start a few ms apart (more with more tracks). Here every seek is
+    issued before any wait, each player's playback-restart is awaited (then seeking == False and not
+    paused-for-cache), and only then are all of them unpaused back to back.
+    """
+
+    def __init__(self, seek_players, resume_players=None, timeout=2.0):
+        self.seek_players = [p for p in seek_players if p is not None]
+        # Players that are only resumed (e.g. the video, already at the target position)
+        self.resume_players = [p for p in (resume_players or []) if p is not None]
+        self.timeout = timeout
+        self.cancelled = False
+        self.resume_times = []  # perf_counter() at each unpause, to measure start skew
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def seek(self, pos, exact=True):
+        """Seek every player to `pos` seconds and block until all of them can play from there"""
+        precision = "exact" if exact else "keyframes"
+        try:
+            with ExitStack() as stack:
+                # Register for playback-restart before seeking so a fast seek can't be missed
+                for player in self.seek_players:
+                    stack.enter_context(player.prepare_and_wait_for_event("playback-restart", timeout=self.timeout))
+                for player in self.seek_players:
+                    player.seek(pos, reference="absolute", precision=precision)
+            for player in self.seek_players:
+                player.wait_for_property("seeking", lambda value: not value, timeout=self.timeout)
+                player.wait_for_property("paused-for-cache", lambda value: not value, timeout=self.timeout)
+        except Exception as e:
+            # A player that never reports back shouldn't hold the others forever
+            print(f"Seek barrier: {e}")
+
+    def resume(self):
+        with self._lock:
+            if self.cancelled:
+                return
+            self.resume_times = []
+            for player in self.seek_players + self.resume_players:
+                try:
+                    player.pause = False
+                    self.resume_times.append(time.perf_counter())
+                except Exception:
+                    pass
+
+    def run(self, pos, resume=True, exact=True):
+        self.seek(pos, exact)
+        if resume:
+            self.resume()
+
+    def start(self, pos, resume=True, exact=True):
+        """run() on a background thread so the GUI doesn't wait for the seeks"""
+        self.thread = threading.Thread(target=self.run, args=(pos, resume, exact), daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        # e.g. paused again before the seeks finished: don't unpause anything.
+        # Once this returns, a resume is either complete or will never happen.
+        with self._lock:
+            self.cancelled = True
+
+# ------------------------------ Media Loading (background thread) ------------------------------ #
+class MediaLoadWorker(QObject):
+    """Runs the probe -> extract -> player setup pipeline for one file on a QThread"""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(int, str, int)  # (generation, file_path, number of tracks opened)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, audio, file_path, generation):
+        super().__init__()
+        self.audio = audio
+        self.file_path = file_path
+        self.generation = generation  # from AudioManager.cancel_load(), results are dropped once it's stale
+
+    @pyqtSlot()
+    def run(self):
+        name = os.path.basename(self.file_path)
+        try:
+            self.progress.emit(f"Reading media info:\n{name}")
+            num_audio_tracks = self.audio.detect_audio_tracks(self.file_path, self.generation)
+            if num_audio_tracks == 0 or not self.audio.is_current(self.generation):
+                self.finished.emit(self.generation, self.file_path, 0)
+                return
+
+            # Open ALL audio tracks (no hard cap), extracted or straight from the source per audio mode
+            self.progress.emit(f"Loading {num_audio_tracks} audio track(s) from:\n{name}")
+            opened = self.audio.open_audio_tracks(self.file_path, generation=self.generation)
+            self.finished.emit(self.generation, self.file_path, opened)
+        except Exception as e:
+            print(f"Error loading media: {e}")
+            self.failed.emit(self.generation, self.file_path)
+
+# ------------------------------ Folder Scan ------------------------------ #
+# Same set the Open dialog offers
+MEDIA_EXTENSIONS = (".mp4", ".mkv", ".avi", ".mov")
+
+class DirectoryScanWorker(QObject):
+    """Probes every media file under a folder with a bounded pool of ffprobe processes, streaming results back.
+
+    Each result is stored in the probe database, so files scanned once open without probing later.
+    """
+    found = pyqtSignal(int)           # number of files about to be probed
+    probed = pyqtSignal(str, object)  # (file_path, MediaInfo or None), in completion order
+    finished = pyqtSignal()
+
+    def __init__(self, audio, directory, workers=None):
+        super().__init__()
+        self.audio = audio
+        self.directory = directory
+        self.workers = workers or audio.max_workers or physical_core_count()
+        self.stopped = False
+        self.processes = []
+        self._lock = threading.Lock()
+
+    def run_tool(self, cmd):
+        # Like AudioManager.run_tool, but the processes belong to this scan (opening a file doesn't kill them)
+        if self.stopped:
+            return ""
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        with self._lock:
+            self.processes.append(proc)
+        try:
+            stdout, _ = proc.communicate()
+        finally:
+            with self._lock:
+                self.processes.remove(proc)
+        return stdout
+
+    @pyqtSlot()
+    def run(self):
+        paths = []
+        for root, dirs, files in os.walk(self.directory):
+            if self.stopped:
+                break
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(MEDIA_EXTENSIONS):
+                    paths.append(os.path.join(root, name))
+        self.found.emit(len(paths))
+
+        # Threads only wait on ffprobe children, so this bounds the number of ffprobe processes running
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        futures = {pool.submit(self.audio.probe_file, path, self.run_tool): path for path in paths}
+        try:
+            for future in as_completed(futures):
+                if self.stopped:
+                    break
+                try:
+                    info = future.result()
+                except Exception as e:
+                    print(f"Error probing {futures[future]}: {e}")
+                    info = None
+                self.probed.emit(futures[future], info)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.finished.emit()
+
+    def stop(self):
+        self.stopped = True
+        with self._lock:
+            processes = list(self.processes)
+        for proc in processes:
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
+class DirectoryScanDialog(QDialog):
+    """Table of every media file under a folder with its audio tracks, codecs, duration and resolution"""
+    file_chosen = pyqtSignal(str)
+
+    COLUMNS = ["File", "Audio Tracks", "Codecs", "Duration", "Resolution"]
+
+    def __init__(self, audio, directory, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Scan Folder - {os.path.basename(directory) or directory}")
+        self.resize(900, 500)
+        self.directory = directory
+        self.total = 0
+        self.done_count = 0
+
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel("Looking for media files...")
+        layout.addWidget(self.status_label)
+
+        self.multi_only = QCheckBox("Only files with multiple audio tracks")
+        self.multi_only.toggled.connect(self.apply_filter)
+        layout.addWidget(self.multi_only)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.cellDoubleClicked.connect(self._on_double_click)
+        layout.addWidget(self.table)
+
+        self.scan_thread = QThread(self)
+        self.scan_worker = DirectoryScanWorker(audio, directory)
+        self.scan_worker.moveToThread(self.scan_thread)
+        self.scan_thread.started.connect(self.scan_worker.run)
+        self.scan_worker.found.connect(self._on_found)
+        self.scan_worker.probed.connect(self._on_probed)
+        self.scan_worker.finished.connect(self._on_finished)
+        self.scan_worker.finished.connect(self.scan_thread.quit)
+        self.scan_thread.finished.connect(self.scan_worker.deleteLater)
+        self.scan_thread.start()
+
+    def _on_found(self, total):
+        self.total = total
+        self.status_label.setText(f"Probing {total} file(s)...")
+
+    def _on_probed(self, file_path, info):
+        self.done_count += 1
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+
+        name_item = QTableWidgetItem(os.path.relpath(file_path, self.directory))
+        name_item.setData(Qt.ItemDataRole.UserRole, file_path)
+        name_item.setToolTip(file_path)
+        self.table.setItem(row, 0, name_item)
+
+        if info is None:
+            self.table.setItem(row, 2, QTableWidgetItem("unreadable"))
+        else:
+            tracks_item = QTableWidgetItem()
+            tracks_item.setData(Qt.ItemDataRole.DisplayRole, info.audio_count)  # sorts numerically
+            self.table.setItem(row, 1, tracks_item)
+            codecs = ", ".join(stream["codec"] or "?" for stream in info.audio_streams)
+            self.table.setItem(row, 2, QTableWidgetItem(codecs))
+            if info.duration:
+                seconds = int(info.duration)
+                self.table.setItem(row, 3, QTableWidgetItem(
+                    f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+                ))
+            if info.resolution:
+                self.table.setItem(row, 4, QTableWidgetItem("{}x{}".format(*info.resolution)))
+        self.table.setRowHidden(row, not self._row_visible(row))
+        self.status_label.setText(f"Probed {self.done_count} of {self.total} file(s)...")
+
+    def _on_finished(self):
+        # Sorting is only turned on once all rows are in, so inserts don't reshuffle the table.
+        # Most tracks first.
+        self.table.setSortingEnabled(True)
+        self.table.sortItems(1, Qt.SortOrder.DescendingOrder)
+        multi = sum(1 for row in range(self.table.rowCount()) if self._track_count(row) > 1)
+        self.status_label.setText(
+            f"{self.done_count} file(s) scanned, {multi} with multiple audio tracks. Double-click a file to open it."
+        )
+
+    def _track_count(self, row):
+        item = self.table.item(row, 1)
+        return item.data(Qt.ItemDataRole.DisplayRole) if item else 0
+
+    def _row_visible(self, row):
+        return not self.multi_only.isChecked() or self._track_count(row) > 1
+
+    def apply_filter(self):
+        for row in range(self.table.rowCount()):
+            self.table.setRowHidden(row, not self._row_visible(row))
+
+    def _on_double_click(self, row, column):
+        item = self.table.item(row, 0)
+        if item:
+            self.file_chosen.emit(item.data(Qt.ItemDataRole.UserRole))
+
+    def stop_scan(self):
+        """Stop the scan, kill its ffprobe processes and wait for the thread to end"""
+        self.scan_worker.stop()
+        self.scan_thread.quit()
+        self.scan_thread.wait()
+
+    def done(self, result):
+        # Closing the dialog stops the scan and its ffprobe processes
+        self.stop_scan()
+        super().done(result)
+
+# ------------------------------ Timeline Thumbnails ------------------------------ #
+THUMBNAIL_WIDTH = 160     # tile width in px, height follows the aspect ratio
+THUMBNAIL_COLUMNS = 10
+THUMBNAIL_MAX_TILES = 200  # long files get a wider interval rather than a bigger sheet
+
+class ThumbnailSheet:
+    """One sprite sheet of evenly spaced frames: tile k shows the frame at k * interval seconds"""
+
+    def __init__(self, file_path, image, interval, count, columns):
+        self.file_path = file_path
+        self.image = image  # QImage, decoded off the GUI thread
+        self.interval = interval
+        self.count = count
+        self.columns = columns
+        rows = max(1, math.ceil(count / columns))
+        self.tile_width = image.width() // columns
+        self.tile_height = image.height() // rows
+
+    def tile_at(self, ms):
+        """QImage of the tile nearest to `ms`"""
+        index = max(0, min(self.count - 1, round(ms / 1000.0 / self.interval)))
+        row, column = divmod(index, self.columns)
+        return self.image.copy(column * self.tile_width, row * self.tile_height, self.tile_width, self.tile_height)
+
+class ThumbnailGenerator(QObject):
+    """Builds a file's sprite sheet in the background with short low-priority ffmpeg runs, cached on disk.
+
+    Each tile is its own ffmpeg run seeking exactly to k * interval, so tiles show their slot's
+    time whatever the keyframe spacing, at the cost of decoding from the keyframe before it.
+    """
+    ready = pyqtSignal(object)  # ThumbnailSheet
+
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self.interval = settings.get("thumbnail_interval", 10)
+        budget_mb = settings.get("thumbnail_cache_mb", 256)
+        self.cache = ExtractionCache(os.path.join(CACHE_DIR, "thumbnails"), budget_mb * 1024 * 1024) if budget_mb else None
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.job = None  # (file_path, ffmpeg process) of the sheet being built
+        self._lock = threading.Lock()
+
+    def layout(self, duration):
+        """(interval, tile count) covering `duration` seconds within THUMBNAIL_MAX_TILES"""
+        interval = max(self.interval, duration / THUMBNAIL_MAX_TILES)
+        return interval, max(1, math.ceil(duration / interval))
+
+    def build_cmd(self, file_path, seconds):
+        """ffmpeg writing the frame at `seconds`, scaled to a tile, as PNG to stdout"""
+        cmd = []
+        # Lowest CPU priority and a single thread so it never competes with playback
+        if shutil.which("nice"):
+            cmd.extend(["nice", "-n", "19"])
+        cmd.extend([
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-threads", "1",
+            "-ss", f"{seconds:.3f}",  # seeks to the keyframe before, then decodes up to the exact time
+            "-i", file_path,
+            "-an", "-sn",
+            "-vf", f"scale={THUMBNAIL_WIDTH}:-2",
+            "-frames:v", "1",
+            "-f", "image2pipe", "-c:v", "png", "-",
+        ])
+        return cmd
+
+    def request(self, file_path, duration):
+        """Start building the sheet for `file_path`, replacing any request still running"""
+        self.cancel()
+        if not self.interval or not duration or not self.cache:
+            return
+        with self._lock:
+            self.job = (file_path, None)
+        self.pool.submit(self._build, file_path, duration)
+
+    def cancel(self):
+        with self._lock:
+            job, self.job = self.job, None
+        if job and job[1] and job[1].poll() is None:
+            try:
+                job[1].kill()
+            except Exception:
+                pass
+
+    def _grab(self, file_path, seconds):
+        """The tile for `seconds` as a QImage (null if there is no frame there, e.g. past the last one),
+        or None if the run was cancelled or failed"""
+        proc = subprocess.Popen(
+            self.build_cmd(file_path, seconds),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        with self._lock:
+            current = self.job is not None and self.job[0] == file_path
+            if current:
+                self.job = (file_path, proc)
+        if not current:
+            proc.kill()
+        data, _ = proc.communicate()
+        with self._lock:
+            current = self.job is not None and self.job[0] == file_path
+        if not current:
+            return None  # cancel() killed it or another file was requested
+        if proc.returncode != 0:
+            print(f"Thumbnail at {seconds:.3f}s failed (ffmpeg exit code {proc.returncode})")
+            return None
+        if not data:
+            return QImage()  # ffmpeg exits cleanly without output when there is no frame
+        image = QImage.fromData(data, "PNG")
+        return None if image.isNull() else image
+
+    def _build(self, file_path, duration):
+        try:
+            interval, count = self.layout(duration)
+            columns = min(THUMBNAIL_COLUMNS, count)
+            path = self.cache.path_for(file_path, 0, f"thumbs-exact-{interval:.3f}-{count}-{THUMBNAIL_WIDTH}", ".jpg")
+            if not self.cache.lookup(path):
+                sheet = None
+                painter = None
+                previous = None
+                for index in range(count):
+                    tile = self._grab(file_path, index * interval)
+                    if tile is None:
+                        if painter:
+                            painter.end()
+                        return  # cancelled or failed, never cache a sheet with missing tiles
+                    if tile.isNull():
+                        tile = previous  # no frame there (e.g. past the last one), repeat the one before
+                    if tile is None:
+                        continue
+                    if sheet is None:
+                        rows = math.ceil(count / columns)
+                        sheet = QImage(columns * tile.width(), rows * tile.height(), QImage.Format.Format_RGB32)
+                        sheet.fill(Qt.GlobalColor.black)
+                        painter = QPainter(sheet)
+                    row, column = divmod(index, columns)
+                    painter.drawImage(column * sheet.width() // columns, row * tile.height(), tile)
+                    previous = tile
+                if sheet is None:
+                    return
+                painter.end()
+                with self._lock:
+                    if self.job is None or self.job[0] != file_path:
+                        return  # cancelled after the last tile
+                part = self.cache.part_path(path)
+                if not sheet.save(part, "JPG", 85):
+                    return
+                path = self.cache.commit(part)
+            image = QImage(path)
+            if image.isNull():
+                return
+            with self._lock:
+                if self.job is None or self.job[0] != file_path:
+                    return  # another file was opened meanwhile
+                self.job = None
+            self.ready.emit(ThumbnailSheet(file_path, image, interval, count, columns))
+        except Exception as e:
+            print(f"Error generating thumbnails: {e}")
+
 # ------------------------------ Control Panel (dynamic track controls) ------------------------------ #
 class ClickableSlider(QSlider):
+    # (value under the cursor, cursor x) while the mouse is over a horizontal slider
+    hovered = pyqtSignal(int, int)
+    hover_left = pyqtSignal()
+
+    def mouseMoveEvent(self, event):
+        x = int(event.position().x())
+        self.hovered.emit(QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), x, self.width()), x)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.hover_left.emit()
+        super().leaveEvent(event)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             value = QStyle.sliderValueFromPosition(
@@ -636,6 +2627,14 @@ class ControlPanel(QWidget):
         self.timeline_slider.setRange(0, 0)
         self.timeline_label = QLabel("00:00 / 00:00")
 
+        # Hover preview: tiles come from a ThumbnailSheet decoded in the background
+        self.thumbnail_sheet = None
+        self.thumbnail_popup = QLabel(self, Qt.WindowType.ToolTip)
+        self.thumbnail_popup.hide()
+        self.timeline_slider.setMouseTracking(True)
+        self.timeline_slider.hovered.connect(self.show_thumbnail)
+        self.timeline_slider.hover_left.connect(self.thumbnail_popup.hide)
+
         # Info label
         self.info_label = QLabel("No File Loaded")
 
@@ -825,6 +2824,24 @@ class ControlPanel(QWidget):
     def set_info_text(self, text):
         self.info_label.setText(text)
 
+    def set_thumbnails(self, sheet):
+        self.thumbnail_sheet = sheet
+        if sheet is None:
+            self.thumbnail_popup.hide()
+
+    def show_thumbnail(self, value, x):
+        sheet = self.thumbnail_sheet
+        if sheet is None or self.timeline_slider.maximum() <= 0:
+            return
+        # Just a crop of the already decoded sheet, nothing is decoded here
+        pixmap = QPixmap.fromImage(sheet.tile_at(value))
+        self.thumbnail_popup.setPixmap(pixmap)
+        self.thumbnail_popup.adjustSize()
+        self.thumbnail_popup.move(
+            self.timeline_slider.mapToGlobal(QPoint(x - pixmap.width() // 2, -pixmap.height() - 8))
+        )
+        self.thumbnail_popup.show()
+
     def set_track_vol_label(self, index: int, text: str):
         # set the small percent label for a given track index (if exists)
         try:
@@ -851,11 +2868,12 @@ class MainWindow(QMainWindow):
         self.setAcceptDrops(True)        
 
         # Core components
-        self.video = VideoPlayer(self)
-        self.audio = AudioManager(self)
+        self.video = create_video_player(self.settings.get("video_renderer", "auto"), self)
+        self.audio = AudioManager(self, self.settings)
         self.controls = ControlPanel(self)
         self._pending_resize_path = None
-        self.video.first_frame_ready.connect(self._on_first_video_frame)
+        self.load_threads = set()  # load threads still running, including preempted ones
+        self.scan_dialogs = set()  # open folder scan dialogs, each with its own scan thread
 
 
         # Custom title bar
@@ -878,6 +2896,7 @@ class MainWindow(QMainWindow):
         # File submenu
         file_menu = QMenu("File", self)
         self.export_action = file_menu.addAction("Export Video with Audio Mix...", self.export_video)
+        self.scan_folder_action = file_menu.addAction("Scan Folder for Audio Tracks...", self.scan_folder)
         self.settings_menu.addMenu(file_menu)
 
         # Appearance submenu
@@ -937,7 +2956,100 @@ class MainWindow(QMainWindow):
         self.fullscreen_start_action.setCheckable(True)
         self.fullscreen_start_action.setChecked(self.settings.get("fullscreen_on_start", False))
 
+        # Add frame stats overlay option
+        self.frame_stats_action = control_panel_menu.addAction(
+            "✓ Show Frame Stats" if self.settings.get("show_frame_stats") else "x Show Frame Stats",
+            self.toggle_frame_stats
+        )
+        self.frame_stats_action.setCheckable(True)
+        self.frame_stats_action.setChecked(self.settings.get("show_frame_stats", False))
+
+        # Video renderer (takes effect on restart)
+        renderer_menu = QMenu("Video Renderer (restart)", self)
+        renderer_labels = {
+            "auto": "Automatic",
+            "opengl": "OpenGL",
+            "software": "Software (no OpenGL)",
+        }
+        self.video_renderer_actions = {}
+        for name, label in renderer_labels.items():
+            selected = self.settings.get("video_renderer", "auto") == name
+            action = renderer_menu.addAction(
+                f"● {label}" if selected else f"○ {label}",
+                partial(self.set_video_renderer, name)
+            )
+            action.setCheckable(True)
+            action.setChecked(selected)
+            self.video_renderer_actions[name] = (action, label)
+        control_panel_menu.addMenu(renderer_menu)
+
         self.settings_menu.addMenu(control_panel_menu)
+
+        # Playback submenu
+        playback_menu = QMenu("Playback", self)
+
+        self.progressive_playback_action = playback_menu.addAction(
+            "✓ Play While Extracting" if self.settings.get("progressive_playback") else "x Play While Extracting",
+            self.toggle_progressive_playback
+        )
+        self.progressive_playback_action.setCheckable(True)
+        self.progressive_playback_action.setChecked(self.settings.get("progressive_playback", False))
+
+        playback_menu.addSeparator()
+
+        # Audio mode (takes effect on the next file opened)
+        self.extract_mode_action = playback_menu.addAction(
+            "● Extract Audio Tracks" if self.settings.get("audio_mode", "extract") == "extract" else "○ Extract Audio Tracks",
+            lambda: self.set_audio_mode("extract")
+        )
+        self.extract_mode_action.setCheckable(True)
+        self.extract_mode_action.setChecked(self.settings.get("audio_mode", "extract") == "extract")
+
+        self.direct_mode_action = playback_menu.addAction(
+            "● Play Tracks From Source" if self.settings.get("audio_mode") == "direct" else "○ Play Tracks From Source",
+            lambda: self.set_audio_mode("direct")
+        )
+        self.direct_mode_action.setCheckable(True)
+        self.direct_mode_action.setChecked(self.settings.get("audio_mode") == "direct")
+
+        self.mixer_mode_action = playback_menu.addAction(
+            "● Single Mixer Engine" if self.settings.get("audio_mode") == "mixer" else "○ Single Mixer Engine",
+            lambda: self.set_audio_mode("mixer")
+        )
+        self.mixer_mode_action.setCheckable(True)
+        self.mixer_mode_action.setChecked(self.settings.get("audio_mode") == "mixer")
+
+        # Intermediate format for extracted tracks
+        format_menu = QMenu("Extracted Track Format", self)
+        format_labels = {
+            "wav": "WAV (16-bit)",
+            "flac": "FLAC (smallest lossless)",
+            "f32": "Float PCM (32-bit)",
+            "copy": "Copy Source Stream (no decode)",
+        }
+        self.extract_format_actions = {}
+        for name, label in format_labels.items():
+            selected = self.settings.get("extract_format", "wav") == name
+            action = format_menu.addAction(
+                f"● {label}" if selected else f"○ {label}",
+                partial(self.set_extract_format, name)
+            )
+            action.setCheckable(True)
+            action.setChecked(selected)
+            self.extract_format_actions[name] = (action, label)
+        playback_menu.addMenu(format_menu)
+
+        self.passthrough_action = playback_menu.addAction(
+            "✓ Keep Native Sample Rate/Channels" if self.settings.get("extract_passthrough") else "x Keep Native Sample Rate/Channels",
+            self.toggle_extract_passthrough
+        )
+        self.passthrough_action.setCheckable(True)
+        self.passthrough_action.setChecked(self.settings.get("extract_passthrough", False))
+
+        playback_menu.addSeparator()
+        self.drift_stats_action = playback_menu.addAction("Show Track Drift", self.show_drift_stats)
+
+        self.settings_menu.addMenu(playback_menu)
         self.settings_button.setMenu(self.settings_menu)
 
         # Apply startup preferences
@@ -973,10 +3085,10 @@ class MainWindow(QMainWindow):
         title_layout.setContentsMargins(5, 0, 5, 0)
 
         video_container = QWidget()
-        video_layout = QVBoxLayout(video_container)
-        video_layout.setContentsMargins(0, 0, 0, 0)
-        video_layout.setSpacing(0)
-        video_layout.addWidget(self.video)
+        self.video_layout = QVBoxLayout(video_container)
+        self.video_layout.setContentsMargins(0, 0, 0, 0)
+        self.video_layout.setSpacing(0)
+        self.video_layout.addWidget(self.video)
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -1022,8 +3134,6 @@ class MainWindow(QMainWindow):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setFocus()
         self.setMouseTracking(True)
-        self.video.setMouseTracking(True)
-        self.video.installEventFilter(self)
         self.controls.setMouseTracking(True)
         self.title_bar.setMouseTracking(True)
         QApplication.instance().installEventFilter(self)
@@ -1032,12 +3142,24 @@ class MainWindow(QMainWindow):
         space_shortcut = QShortcut(Qt.Key.Key_Space, self)
         space_shortcut.activated.connect(self.toggle_play_pause)
 
-        # ----- Timer for timeline updates ----- #
-        self.timer = QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_timeline)
+        # ----- Timeline updates ----- #
+        # Driven by VideoPlayer.position_changed (once per display frame while the position moves).
+        # The only timer is for progressive playback waiting on extraction, when the position doesn't move.
+        self.sync = SyncController(self.settings)
+        self.last_sync = 0.0
+        self.seek_barrier = None  # SeekBarrier of the last group seek
+
+        # Timeline hover thumbnails, generated in the background after each load
+        self.thumbnails = ThumbnailGenerator(self.settings, self)
+        self.thumbnails.ready.connect(self._on_thumbnails_ready)
+        self.buffer_timer = QTimer(self)
+        self.buffer_timer.setInterval(250)
+        self.buffer_timer.timeout.connect(lambda: self.check_audio_buffer(self.video.pos()))
 
         self.was_playing = False
+        self.buffering = False  # playback held until progressive extraction gets ahead again
+        self.loading_path = None  # file the background load worker is working on
+        self.extracted_count = 0
 
         # ----- Connections to control panel ----- #
         self.controls.open_request.connect(self.load_video)
@@ -1053,11 +3175,37 @@ class MainWindow(QMainWindow):
 
         # ----- Connections to audio manager ----- #
         self.audio.audio_tracks_detected.connect(self.update_vol_ui)
+        self.audio.track_extracted.connect(self._on_track_extracted)
 
         # ----- Connections to video player ----- #
+        self.connect_video()
+
+    def connect_video(self):
+        """Hook self.video up to the window (again after a renderer fallback replaced it)"""
+        self.video.setMouseTracking(True)
+        self.video.installEventFilter(self)
+        self.video.first_frame_ready.connect(self._on_first_video_frame)
+        self.video.set_stats_overlay(self.settings.get("show_frame_stats", False))
         self.video.position_changed.connect(self.vid_pos_chg)
         self.video.duration_changed.connect(self.update_dur)
         self.video.state_changed.connect(self.vid_state_chg)
+        if isinstance(self.video, VideoPlayer):
+            # Queued: the swap can't happen inside the widget's own initializeGL
+            self.video.render_failed.connect(self.fall_back_to_software_renderer, Qt.ConnectionType.QueuedConnection)
+
+    def fall_back_to_software_renderer(self):
+        """mpv couldn't render through OpenGL here, put a SoftwareVideoPlayer in the OpenGL widget's place"""
+        print("Falling back to the software video renderer")
+        old = self.video
+        self.video = SoftwareVideoPlayer(self)
+        self.video_layout.replaceWidget(old, self.video)
+        old.removeEventFilter(self)
+        old.close()
+        old.hide()
+        old.deleteLater()
+        self.connect_video()
+        # Creates its mpv instance on show. Nothing was loaded yet: the OpenGL widget never had one.
+        self.video.show()
 
     # ----- Event filter / UI hide logic ----- #
     def eventFilter(self, obj, event):
@@ -1162,7 +3310,7 @@ class MainWindow(QMainWindow):
 
     def apply_saved_volumes(self, saved_volumes):
         """Apply saved volumes to audio players and UI sliders"""
-        for i in range(len(self.audio.audio_players)):
+        for i in range(self.audio.track_count()):
             track_key = f"track_{i}"
             if track_key in saved_volumes:
                 volume = saved_volumes[track_key]
@@ -1200,22 +3348,12 @@ class MainWindow(QMainWindow):
 
     # ----- Loading media and control ----- #
     def get_video_resolution(self, file_path):
-        try:
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=width,height",
-                "-of", "json",
-                file_path
-            ]
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            data = json.loads(result.stdout)
-            width = int(data["streams"][0]["width"])
-            height = int(data["streams"][0]["height"])
-            return width, height
-        except Exception:
-            return 1280, 720  # fallback default
+        # Normally already known from the load's probe (or the probe database).
+        # Never through the mpv backend here: that would reload the file that's playing.
+        info = self.audio.probe_media(file_path, use_mpv=False)
+        if info is not None and info.resolution:
+            return info.resolution
+        return 1280, 720  # fallback default
 
     def load_video(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1229,27 +3367,68 @@ class MainWindow(QMainWindow):
         self.current_video_path = file_path  # Store the current video path
         self.controls.set_info_text(f"Loading audio tracks from:\n{os.path.basename(file_path)}")
 
+        if self.is_playing:
+            self.pause()
+            self.is_playing = False
+            self.controls.play_button.setText("Play")
+        self.buffering = False
+        self.loading_path = file_path
+        self.extracted_count = 0
+        # Preempt a load still running for the previous file: its ffmpeg/ffprobe children are killed
+        # and whatever it finishes with is discarded, so this one can start right away
+        generation = self.audio.cancel_load()
         self.audio.cleanup_temp_files()
-
-        try:
-            num_audio_tracks = self.audio.detect_audio_tracks(file_path)
-        except Exception:
-            self.controls.set_info_text("Error reading media file.")
-            return
-
-        self.update_vol_ui(num_audio_tracks)
-        if num_audio_tracks == 0:
-            self.controls.set_info_text("No audio tracks found in the selected file.")
+        self.thumbnails.cancel()
+        self.controls.set_thumbnails(None)
+        self.audio.mixer = self.video.mpv
+        self.audio.mpv_probe = self.video.probe
+        # Drift statistics and corrections belong to the previous file's players
+        self.sync.clear()
+
+        # Probe, extraction and player setup run on a worker thread so the window stays responsive.
+        # The track sliders are built when audio_tracks_detected arrives, the rest in _on_media_loaded.
+        self.load_thread = QThread(self)
+        self.load_worker = MediaLoadWorker(self.audio, file_path, generation)
+        self.load_worker.moveToThread(self.load_thread)
+        self.load_thread.started.connect(self.load_worker.run)
+        self.load_worker.progress.connect(self.controls.set_info_text)
+        self.load_worker.finished.connect(self._on_media_loaded)
+        self.load_worker.failed.connect(self._on_media_load_failed)
+        self.load_worker.finished.connect(self.load_thread.quit)
+        self.load_worker.failed.connect(self.load_thread.quit)
+        self.load_thread.finished.connect(self.load_worker.deleteLater)
+        self.load_thread.finished.connect(partial(self.load_threads.discard, self.load_thread))
+        self.load_thread.finished.connect(self.load_thread.deleteLater)
+        self.load_threads.add(self.load_thread)
+        self.load_thread.start()
+
+    def _on_media_load_failed(self, generation, file_path):
+        if not self.audio.is_current(generation):
             return
+        self.loading_path = None
+        self.controls.set_info_text("Error reading media file.")
+
+    def _on_track_extracted(self, index, path):
+        # Staged progress while a load is running
+        if self.loading_path:
+            self.extracted_count += 1
+            self.controls.set_info_text(
+                f"Extracted {self.extracted_count} audio track(s) from:\n{os.path.basename(self.loading_path)}"
+            )
 
-        # Extract ALL audio tracks (no hard cap)
-        extract = self.audio.extract_audio_tracks(file_path)
-        if len(extract) < 1:
+    def _on_media_loaded(self, generation, file_path, opened):
+        # Back on the GUI thread with the audio players ready
+        if not self.audio.is_current(generation):
+            return  # a newer file was opened while this one was loading
+        self.loading_path = None
+        if opened < 1:
             self.controls.set_info_text("No audio tracks found in the selected file.")
             return
 
         self.video.set_media(file_path)
-        self.video.set_video_muted()
+        if not self.audio.mixer_gains:
+            # Separate audio players are doing the audio, the video player stays silent
+            self.video.set_video_muted()
 
         self.audio.set_audio_src()
         
@@ -1263,11 +3442,19 @@ class MainWindow(QMainWindow):
             # Wait for sliders to be created
             QTimer.singleShot(250, lambda: self.apply_saved_volumes(saved_volumes))
 
-        self.controls.set_info_text(f"Loaded {len(self.audio.temp_files)} audio track(s). Click Play.")
+        self.controls.set_info_text(f"Loaded {self.audio.track_count()} audio track(s). Click Play.")
 
         if self.video.dur() > 0:
             self.update_dur(self.video.dur())
 
+        info = self.audio.media_info
+        if info is not None and info.matches(file_path) and info.has_video:
+            self.thumbnails.request(file_path, info.duration)
+
+    def _on_thumbnails_ready(self, sheet):
+        if sheet.file_path == self.current_video_path:
+            self.controls.set_thumbnails(sheet)
+
     def load_video_from_path(self, file_path):
         if not file_path or not os.path.exists(file_path):
             self.controls.set_info_text("File not found.")
@@ -1300,26 +3487,46 @@ class MainWindow(QMainWindow):
             self.is_playing = False
 
     def play(self):
-        self.video.play()
-        # Sync audio to video position before playing
+        # Sync audio to video position before playing, then start everything together
         if self.video.mpv and self.video.mpv.time_pos:
-            video_pos_ms = int(self.video.mpv.time_pos * 1000)
-            self.audio.set_pos(video_pos_ms)
-        self.audio.play()
-        self.timer.start()
+            self.start_group_seek(int(self.video.mpv.time_pos * 1000), seek_video=False, resume=True)
+        else:
+            self.video.play()
+            self.audio.play()
         self.hide_timer.start()
 
+    def start_group_seek(self, pos, seek_video, resume):
+        """Seek the audio players (and the video too if `seek_video`) to `pos` ms, then resume all at once"""
+        if self.seek_barrier:
+            self.seek_barrier.cancel()
+        if not self.video.mpv:
+            return
+        players = list(self.audio.audio_players)
+        if seek_video:
+            self.seek_barrier = SeekBarrier([self.video.mpv] + players)
+        else:
+            self.seek_barrier = SeekBarrier(players, [self.video.mpv])
+        self.seek_barrier.start(pos / 1000.0, resume)
+
     def pause(self):
+        if self.seek_barrier:
+            self.seek_barrier.cancel()
+        self.buffering = False
+        self.buffer_timer.stop()
         self.video.pause()
         self.audio.pause()
-        self.timer.stop()
+        self.sync.reset(self.audio.audio_players)
         self.hide_timer.stop()
         self.show_controls()
 
     def stop(self):
+        if self.seek_barrier:
+            self.seek_barrier.cancel()
+        self.buffering = False
+        self.buffer_timer.stop()
         self.video.stop()
         self.audio.stop()
-        self.timer.stop()
+        self.sync.reset(self.audio.audio_players)
         self.hide_timer.stop()
         self.is_playing = False
         self.controls.timeline_slider.setValue(0)
@@ -1332,32 +3539,42 @@ class MainWindow(QMainWindow):
         self.controls.set_timeline_range(dur)
         self.controls.set_timeline_label(f"00:00 / {self.update_label(dur)}")
 
-    def update_timeline(self):
+    def update_timeline(self, pos=None):
         if self.is_scrubbing:
             return
 
-        pos = self.video.pos()
+        if pos is None:
+            pos = self.video.pos()
         dur = self.video.dur()
         self.controls.set_timeline_value_blocked(pos)
         self.controls.set_timeline_label(f"{self.update_label(pos)} / {self.update_label(dur)}")
-        
-        # Periodically check for audio/video sync drift during playback
-        # Only correct if drift is significant (> 200ms) to avoid audio glitches
-        if self.is_playing and hasattr(self.audio, 'audio_players') and len(self.audio.audio_players) > 0:
-            try:
-                # Check first audio player as reference
-                audio_player = self.audio.audio_players[0]
-                if audio_player and audio_player.time_pos is not None:
-                    video_pos_sec = pos / 1000.0
-                    audio_pos_sec = audio_player.time_pos
-                    drift = abs(video_pos_sec - audio_pos_sec)
-                    
-                    # If drift is more than 200ms, resync audio to video
-                    if drift > 0.2:
-                        self.audio.set_pos(pos)
-            except Exception:
-                pass  # Ignore sync errors
 
+        self.check_audio_buffer(pos)
+        
+        # Keep the audio tracks on the video clock during playback (speed nudges, seeks only for large drift).
+        # Positions arrive every frame; sampling the players every 50 ms is plenty.
+        now = time.monotonic()
+        if self.is_playing and not self.buffering and self.audio.audio_players and now - self.last_sync >= 0.05:
+            self.last_sync = now
+            self.sync.update(self.video.clock, self.audio.audio_players)
+
+    def check_audio_buffer(self, pos):
+        """Hold playback while progressive extraction is behind the playhead, resume once it's ahead again"""
+        buffered = self.audio.buffered_until()
+        head_start_ms = float(self.settings.get("playback_head_start", 5.0)) * 1000
+
+        if self.buffering:
+            if buffered is None or buffered * 1000 >= pos + head_start_ms:
+                self.buffering = False
+                self.buffer_timer.stop()
+                self.start_group_seek(pos, seek_video=False, resume=True)
+                self.controls.set_info_text(f"Loaded {self.audio.track_count()} audio track(s).")
+        elif self.is_playing and buffered is not None and pos >= buffered * 1000 - 500:
+            self.buffering = True
+            self.buffer_timer.start()
+            self.video.pause()
+            self.audio.pause()
+            self.controls.set_info_text("Buffering audio tracks...")
 
     def update_label(self, ms):
         seconds = ms // 1000
@@ -1368,36 +3585,33 @@ class MainWindow(QMainWindow):
     def preview_seek_pos(self, pos):
         dur = self.video.dur()
         self.controls.set_timeline_label(f"{self.update_label(pos)} / {self.update_label(dur)}")
+        if self.is_scrubbing:
+            # Show the frame under the handle while dragging
+            self.video.scrub_to(pos)
 
     def start_scrub(self):
         self.was_playing = self.video._is_playing
         self.is_scrubbing = True
         self.video.pause()
         self.audio.pause()
-        self.timer.stop()
+        self.sync.reset(self.audio.audio_players)
         self.hide_timer.stop()
 
     def end_scrub(self):
         self.is_scrubbing = False
         pos = self.controls.timeline_slider.value()
+        self.video.end_scrub()
 
-        self.video.set_pos(pos)
-        self.audio.set_pos(pos)
+        # Video and audio seek as a group and (if playing) resume together once all are ready
+        self.start_group_seek(pos, seek_video=True, resume=self.was_playing)
 
         if self.was_playing:
-            self.video.play()
-            # Re-sync audio to video position before resuming (in case there was any drift)
-            if self.video.mpv and self.video.mpv.time_pos:
-                video_pos_ms = int(self.video.mpv.time_pos * 1000)
-                self.audio.set_pos(video_pos_ms)
-            self.audio.play()
-            self.timer.start()
             self.hide_timer.start()
         else:
             self.show_controls()
 
     def vid_pos_chg(self, pos):
-        pass
+        self.update_timeline(pos)
 
     def vid_state_chg(self, playing: bool):
         self.is_playing = playing
@@ -1593,7 +3807,7 @@ class MainWindow(QMainWindow):
         )
     
         # Rebuild the volume controls
-        num_tracks = len(self.audio.audio_players)
+        num_tracks = self.audio.track_count()
         if num_tracks > 0:
             self.rebuild_volume_controls(num_tracks)
 
@@ -1633,6 +3847,109 @@ class MainWindow(QMainWindow):
             "✓ Fullscreen on Start" if new_value else "x Fullscreen on Start"
         )
 
+    def toggle_frame_stats(self):
+        """Toggle the frame pacing overlay on the video"""
+        new_value = not self.settings.get("show_frame_stats", False)
+        self.settings["show_frame_stats"] = new_value
+        save_settings(self.settings)
+        self.frame_stats_action.setChecked(new_value)
+        # Update text to show checkmark
+        self.frame_stats_action.setText(
+            "✓ Show Frame Stats" if new_value else "x Show Frame Stats"
+        )
+        self.video.set_stats_overlay(new_value)
+
+    def set_video_renderer(self, name):
+        """Choose the OpenGL or software video widget used from the next start"""
+        self.settings["video_renderer"] = name
+        save_settings(self.settings)
+
+        # Update checkmarks and text
+        for key, (action, label) in self.video_renderer_actions.items():
+            action.setChecked(key == name)
+            action.setText(f"● {label}" if key == name else f"○ {label}")
+
+    def toggle_progressive_playback(self):
+        """Toggle starting playback before every audio track has finished extracting"""
+        current = self.settings.get("progressive_playback", False)
+        new_value = not current
+        self.settings["progressive_playback"] = new_value
+        save_settings(self.settings)
+        self.progressive_playback_action.setChecked(new_value)
+        # Update text to show checkmark
+        self.progressive_playback_action.setText(
+            "✓ Play While Extracting" if new_value else "x Play While Extracting"
+        )
+
+    def set_audio_mode(self, mode):
+        """Switch between extracted tracks, tracks played from the source, and the single mixer engine"""
+        self.settings["audio_mode"] = mode
+        save_settings(self.settings)
+
+        # Update checkmarks and text
+        self.extract_mode_action.setChecked(mode == "extract")
+        self.extract_mode_action.setText(
+            "● Extract Audio Tracks" if mode == "extract" else "○ Extract Audio Tracks"
+        )
+
+        self.direct_mode_action.setChecked(mode == "direct")
+        self.direct_mode_action.setText(
+            "● Play Tracks From Source" if mode == "direct" else "○ Play Tracks From Source"
+        )
+
+        self.mixer_mode_action.setChecked(mode == "mixer")
+        self.mixer_mode_action.setText(
+            "● Single Mixer Engine" if mode == "mixer" else "○ Single Mixer Engine"
+        )
+
+    def set_extract_format(self, name):
+        """Choose the intermediate format used for newly extracted tracks"""
+        self.settings["extract_format"] = name
+        save_settings(self.settings)
+
+        # Update checkmarks and text
+        for key, (action, label) in self.extract_format_actions.items():
+            action.setChecked(key == name)
+            action.setText(f"● {label}" if key == name else f"○ {label}")
+
+    def toggle_extract_passthrough(self):
+        """Toggle extracting tracks at their own sample rate and channel layout"""
+        current = self.settings.get("extract_passthrough", False)
+        new_value = not current
+        self.settings["extract_passthrough"] = new_value
+        save_settings(self.settings)
+        self.passthrough_action.setChecked(new_value)
+        # Update text to show checkmark
+        self.passthrough_action.setText(
+            "✓ Keep Native Sample Rate/Channels" if new_value else "x Keep Native Sample Rate/Channels"
+        )
+
+    def scan_folder(self):
+        """List every media file in a folder with its audio tracks, to find the multi-track ones"""
+        directory = QFileDialog.getExistingDirectory(self, "Select Folder to Scan")
+        if not directory:
+            return
+        dialog = DirectoryScanDialog(self.audio, directory, self)
+        dialog.file_chosen.connect(self.load_video_from_path)
+        dialog.finished.connect(partial(self.scan_dialogs.discard, dialog))
+        self.scan_dialogs.add(dialog)
+        dialog.show()
+
+    def show_drift_stats(self):
+        """Show each track's recent drift against the video in the info label"""
+        lines = []
+        for i, stats in enumerate(self.sync.stats()):
+            if stats is None:
+                continue
+            lines.append(
+                f"Track {i + 1}: mean {stats['mean']:+.0f} ms, p95 {stats['p95']:.0f} ms, "
+                f"range {stats['min']:+.0f}..{stats['max']:+.0f} ms"
+            )
+        if not lines:
+            self.controls.set_info_text("No drift measured yet. Play a file first.")
+            return
+        self.controls.set_info_text("\n".join(lines))
+
     def export_video(self):
         """Export video with mixed audio tracks using ffmpeg"""
         # Check if a video is loaded
@@ -1642,7 +3959,7 @@ class MainWindow(QMainWindow):
             return
         
         # Check if there are audio tracks
-        num_tracks = len(self.audio.audio_players)
+        num_tracks = self.audio.track_count()
         if num_tracks == 0:
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "No Audio Tracks", "The current video has no audio tracks to mix.")
@@ -1674,7 +3991,7 @@ class MainWindow(QMainWindow):
             # Start with input video
             cmd = ["ffmpeg", "-i", self.current_video_path]
             
-            # Add all audio track files as inputs
+            # Add all audio track files as inputs (none when playing straight from the source)
             for temp_file in self.audio.temp_files:
                 cmd.extend(["-i", temp_file])
             
@@ -1690,8 +4007,13 @@ class MainWindow(QMainWindow):
                 except Exception:
                     volume = 1.0  # Default to normal volume if error
                 
-                # Audio input index is i+1 (video is 0, first audio is 1, etc.)
-                filter_parts.append(f"[{i+1}:a]volume={volume}[a{i}]")
+                # The track gain is applied at playback time, so apply it to the export too
+                if self.audio.temp_files:
+                    # Audio input index is i+1 (video is 0, first audio is 1, etc.)
+                    filter_parts.append(f"[{i+1}:a]volume={volume * TRACK_GAIN}[a{i}]")
+                else:
+                    # Tracks played from the source: take them from input 0
+                    filter_parts.append(f"[0:a:{i}]volume={volume * TRACK_GAIN}[a{i}]")
             
             # Mix all adjusted audio streams
             mix_inputs = "".join([f"[a{i}]" for i in range(num_tracks)])
@@ -1771,19 +4093,25 @@ class MainWindow(QMainWindow):
 
     # ----- Cleanup ----- #
     def closeEvent(self, event):
-        self.timer.stop()
+        self.buffer_timer.stop()
         self.hide_timer.stop()
+        self.thumbnails.cancel()
 
         self.video.stop()
-        self.video.position_timer.stop()
-        if self.video.mpv is not None:
-            try:
-                self.video.mpv.terminate()
-            except Exception:
-                pass
+        # Frees the render context before terminating mpv
+        self.video.close()
+
+        # Scans probe through the audio manager's database, stop them before it closes
+        for dialog in list(self.scan_dialogs):
+            dialog.stop_scan()
 
         self.audio.cleanup_on_close()
 
+        # Their processes were just killed; let the threads end before Qt destroys them
+        for thread in list(self.load_threads):
+            thread.quit()
+            thread.wait()
+
         event.accept()
 
     def dragEnterEvent(self, event):
@@ -0,0 +1,62 @@
+"""Shared helpers for the benchmark scripts.
+
+The player is a single script (with a space in its file name), so it is loaded with importlib
+rather than imported. Test media is generated with ffmpeg's lavfi sources, so no sample files
+are needed.
+"""
+import importlib.util
+import os
+import subprocess
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(ROOT, "Crusty_Media_Player_Linux v1.3.0.py")
+
+CHANNEL_LAYOUTS = {1: "mono", 2: "stereo", 6: "5.1", 8: "7.1"}
+
+
+def load_app():
+    """Load the Linux player script as a module (its __main__ block does not run)"""
+    spec = importlib.util.spec_from_file_location("crusty_media_player", APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_test_media(path, audio_tracks, duration=30, sample_rate=48000, channels=2,
+                    audio_codec="flac", video=True, size="320x240", rate=25):
+    """Write a test file with `audio_tracks` sine tracks (a different pitch per track)"""
+    cmd = ["ffmpeg", "-v", "error", "-nostdin", "-y"]
+    if video:
+        cmd += ["-f", "lavfi", "-i", f"testsrc2=size={size}:rate={rate}:duration={duration}"]
+    layout = CHANNEL_LAYOUTS.get(channels, "stereo")
+    for i in range(audio_tracks):
+        freq = 220 + 110 * i
+        cmd += ["-f", "lavfi", "-i",
+                f"aevalsrc=exprs=sin({freq}*2*PI*t):c={layout}:s={sample_rate}:d={duration}"]
+    offset = 1 if video else 0
+    if video:
+        cmd += ["-map", "0:v", "-c:v", "mpeg4", "-q:v", "5"]
+    for i in range(audio_tracks):
+        cmd += ["-map", f"{i + offset}:a"]
+    cmd += ["-c:a", audio_codec, path]
+    subprocess.run(cmd, check=True)
+    return path
+
+
+def timed(fn, *args, **kwargs):
+    """Run fn and return (result, wall_seconds, child_cpu_seconds)"""
+    before = os.times()
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    wall = time.perf_counter() - start
+    after = os.times()
+    cpu = (after.children_user - before.children_user) + (after.children_system - before.children_system)
+    return result, wall, cpu
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths)))
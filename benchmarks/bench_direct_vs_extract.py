@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Load latency, RSS, CPU and temp-disk use of extracted WAV tracks versus direct (aid=N) playback.
+
+    python3 benchmarks/bench_direct_vs_extract.py [--tracks 8] [--duration 120] [--play-seconds 10]
+
+Audio goes to mpv's null output, so this runs on machines without a sound card.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from _common import load_app, make_test_media, print_table
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def run_mode(app, mode, source, play_seconds):
+    # No cache or probe database, so neither mode benefits from the other having run first
+    manager = app.AudioManager(settings={"audio_mode": mode, "cache_budget_mb": 0, "probe_db_max_rows": 0})
+    manager.player_options = {"ao": "null"}
+
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    manager.open_audio_tracks(source)
+    for player in manager.audio_players:
+        player.wait_for_property("duration", timeout=30)
+    load = time.perf_counter() - start
+    disk = sum(os.path.getsize(path) for path in manager.temp_files)
+
+    cpu_before = cpu_seconds()
+    manager.play()
+    time.sleep(play_seconds)
+    play_cpu = (cpu_seconds() - cpu_before) / play_seconds * 100
+    rss = rss_mb() - rss_before
+
+    manager.cleanup_on_close()
+    manager.cleanup_temp_files()
+    return [mode, f"{load:.2f}s", f"{play_cpu:.1f}%", f"{rss:.1f} MB", f"{disk / 1024 / 1024:.1f} MB"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=8)
+    parser.add_argument("--duration", type=int, default=120, help="test media length in seconds")
+    parser.add_argument("--play-seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    app = load_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        source = make_test_media(os.path.join(tmp, "source.mkv"), args.tracks, args.duration)
+        rows = [run_mode(app, mode, source, args.play_seconds) for mode in ("extract", "direct")]
+
+    print(f"{args.tracks} tracks, {args.duration}s media, CPU averaged over {args.play_seconds}s of playback")
+    print_table(["mode", "load", "play CPU", "RSS", "temp disk"], rows)
+
+
+if __name__ == "__main__":
+    main()
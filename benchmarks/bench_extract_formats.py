@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Disk footprint and extraction throughput of each intermediate track format (EXTRACT_FORMATS).
+
+    python3 benchmarks/bench_extract_formats.py [--tracks 4] [--duration 300] [--codec aac]
+"""
+import argparse
+import os
+import tempfile
+
+from _common import load_app, make_test_media, print_table, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=4)
+    parser.add_argument("--duration", type=int, default=300, help="test media length in seconds")
+    parser.add_argument("--codec", default="aac", help="audio codec of the generated source")
+    args = parser.parse_args()
+
+    app = load_app()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source = make_test_media(os.path.join(tmp, "source.mkv"), args.tracks, args.duration,
+                                 audio_codec=args.codec)
+        for name in app.EXTRACT_FORMATS:
+            manager = app.AudioManager(settings={"extract_format": name})
+            _, suffix = manager.output_format()
+            outputs = [(i, os.path.join(tmp, f"{name}_{i}{suffix}")) for i in range(args.tracks)]
+            paths, wall, cpu = timed(manager.extract_streams, source, outputs)
+
+            size = sum(os.path.getsize(path) for path in paths)
+            track_minutes = args.tracks * args.duration / 60
+            realtime = args.tracks * args.duration / wall
+            rows.append([name, f"{size / track_minutes / 1024 / 1024:.2f} MB",
+                         f"{wall:.2f}s", f"{cpu:.2f}s", f"{realtime:.0f}x"])
+            for path in paths:
+                os.unlink(path)
+
+    print(f"{args.tracks} {args.codec} tracks of {args.duration}s")
+    print_table(["format", "per track-minute", "wall", "ffmpeg CPU", "track-seconds/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
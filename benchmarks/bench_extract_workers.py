@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Wall time and source bytes read by AudioManager.extract_streams versus worker count, for 1-32 audio tracks.
+
+    python3 benchmarks/bench_extract_workers.py [--duration 60] [--max-tracks 32]
+
+Every ffmpeg job demuxes the whole source, so more workers trade extra source reads for
+parallel decoding. "read" is the bytes all ffmpeg children read (rchar from /proc/<pid>/io,
+polled while they run, so the last few reads before exit are missed) relative to the source
+size. "auto" is the default_extract_workers count used when extract_workers is 0.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from _common import load_app, make_test_media, print_table, timed
+
+
+class ReadCounter:
+    """Adds up the bytes read by every process the manager registers"""
+
+    def __init__(self, manager):
+        self.total = 0
+        self._lock = threading.Lock()
+        self._threads = []
+        register = manager.register_process
+
+        def register_and_watch(proc):
+            register(proc)
+            thread = threading.Thread(target=self._watch, args=(proc.pid,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        manager.register_process = register_and_watch
+
+    def _watch(self, pid):
+        last = 0
+        while True:
+            try:
+                with open(f"/proc/{pid}/io") as f:
+                    for line in f:
+                        if line.startswith("rchar:"):
+                            last = max(last, int(line.split()[1]))
+            except (OSError, ValueError):
+                break
+            time.sleep(0.01)
+        with self._lock:
+            self.total += last
+
+    def take(self):
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        total, self.total = self.total, 0
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=int, default=60, help="test media length in seconds")
+    parser.add_argument("--max-tracks", type=int, default=32)
+    args = parser.parse_args()
+
+    app = load_app()
+    manager = app.AudioManager(settings={"cache_budget_mb": 0})
+    reads = ReadCounter(manager)
+
+    track_counts = [n for n in (1, 2, 4, 8, 16, 32) if n <= args.max_tracks]
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, app.physical_core_count()})
+    print(f"physical cores: {app.physical_core_count()}, media length: {args.duration}s")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for tracks in track_counts:
+            source = make_test_media(os.path.join(tmp, f"src_{tracks}.mkv"), tracks, args.duration)
+            size = os.path.getsize(source)
+            auto = app.default_extract_workers(tracks)
+            row = [tracks, auto]
+            for workers in worker_counts + [None]:
+                outputs = [(i, os.path.join(tmp, f"out_{i}.wav")) for i in range(tracks)]
+                _, wall, _ = timed(manager.extract_streams, source, outputs, workers)
+                row.append(f"{wall:.2f}s / {reads.take() / size:.1f}x")
+                for _, path in outputs:
+                    os.unlink(path)
+            rows.append(row)
+
+    print("wall time / source bytes read (multiples of the source size)")
+    print_table(["tracks", "auto workers"] + [f"{w} workers" for w in worker_counts] + ["auto"], rows)
+
+
+if __name__ == "__main__":
+    main()
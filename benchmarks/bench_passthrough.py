@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""ffmpeg CPU time for extracting multichannel tracks converted to 2ch/44.1 kHz versus passed through natively.
+
+    python3 benchmarks/bench_passthrough.py [--tracks 4] [--duration 300] [--format wav]
+"""
+import argparse
+import os
+import tempfile
+
+from _common import CHANNEL_LAYOUTS, load_app, make_test_media, print_table, timed
+
+MATERIAL = [(48000, 6), (48000, 8), (96000, 6), (96000, 8)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=4)
+    parser.add_argument("--duration", type=int, default=300, help="test media length in seconds")
+    parser.add_argument("--format", default="wav", help="intermediate format (see EXTRACT_FORMATS)")
+    args = parser.parse_args()
+
+    app = load_app()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rate, channels in MATERIAL:
+            source = make_test_media(os.path.join(tmp, f"source_{rate}_{channels}.mkv"), args.tracks,
+                                     args.duration, sample_rate=rate, channels=channels, video=False)
+            row = [f"{rate // 1000} kHz {CHANNEL_LAYOUTS[channels]}"]
+            for passthrough in (False, True):
+                manager = app.AudioManager(settings={"extract_format": args.format,
+                                                     "extract_passthrough": passthrough})
+                _, suffix = manager.output_format()
+                outputs = [(i, os.path.join(tmp, f"out_{i}{suffix}")) for i in range(args.tracks)]
+                paths, wall, cpu = timed(manager.extract_streams, source, outputs, 1)
+                row += [f"{cpu:.2f}s", f"{wall:.2f}s"]
+                for path in paths:
+                    os.unlink(path)
+            rows.append(row)
+
+    print(f"{args.tracks} FLAC tracks of {args.duration}s each, one ffmpeg worker, {args.format} output")
+    print_table(["material", "2ch/44.1k CPU", "wall", "native CPU", "wall"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Open-to-ready latency of the ffprobe probe backend versus reading track-list from libmpv.
+
+    python3 benchmarks/bench_probe_latency.py [--files 10] [--tracks 8] [--duration 30]
+
+"probe" is the time to get a MediaInfo. "ready" adds what it takes until the player has the file
+open: the ffprobe backend still has to loadfile afterwards, the mpv backend already has. A
+headless mpv instance (null video/audio output) stands in for the video player's, and the probe
+database is off so every open is cold.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import mpv
+
+from _common import load_app, make_test_media, print_table
+
+
+def load_into(player, path):
+    player.pause = True
+    with player.prepare_and_wait_for_event("file-loaded", "end-file", timeout=30):
+        player.loadfile(path)
+
+
+def summarize(name, probe_times, ready_times):
+    ms = lambda values, fn: f"{fn(values) * 1000:.1f}"
+    return [name, ms(probe_times, statistics.median), ms(probe_times, max),
+            ms(ready_times, statistics.median), ms(ready_times, max)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10, help="number of distinct test files")
+    parser.add_argument("--tracks", type=int, default=8)
+    parser.add_argument("--duration", type=int, default=30, help="test media length in seconds")
+    args = parser.parse_args()
+
+    app = load_app()
+    manager = app.AudioManager(settings={"cache_budget_mb": 0, "probe_db_max_rows": 0})
+
+    start = time.perf_counter()
+    player = mpv.MPV(vo="null", ao="null", idle=True, keep_open=True, ytdl=False)
+    startup = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = [
+            make_test_media(os.path.join(tmp, f"source{i}.mkv"), args.tracks, args.duration)
+            for i in range(args.files)
+        ]
+
+        times = {"ffprobe": ([], []), "mpv": ([], [])}
+        for source in sources:
+            start = time.perf_counter()
+            info = manager.ffprobe_media(source)
+            probed = time.perf_counter()
+            load_into(player, source)
+            ready = time.perf_counter()
+            assert info and info.audio_count == args.tracks
+            times["ffprobe"][0].append(probed - start)
+            times["ffprobe"][1].append(ready - start)
+
+            player.command("stop")
+            start = time.perf_counter()
+            info = app.probe_with_mpv(player, source)
+            ready = time.perf_counter()
+            assert info and info.audio_count == args.tracks
+            times["mpv"][0].append(ready - start)
+            times["mpv"][1].append(ready - start)
+            player.command("stop")
+
+    player.terminate()
+
+    print(f"{args.files} files, {args.tracks} audio tracks each, mpv instance startup {startup * 1000:.1f} ms (once)")
+    print_table(
+        ["backend", "probe median ms", "probe max ms", "ready median ms", "ready max ms"],
+        [summarize(name, *values) for name, values in times.items()],
+    )
+
+
+if __name__ == "__main__":
+    main()
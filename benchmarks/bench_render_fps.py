@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Headless decode + render throughput of the OpenGL and software render paths (no window).
+
+    python3 benchmarks/bench_render_fps.py [--size 3840x2160] [--rate 60] [--duration 10] [--software]
+    python3 benchmarks/bench_render_fps.py --file movie.mkv --frames 2000 --renderer sw
+
+mpv renders every frame as fast as it can (untimed, audio off), so frames/sec is the
+throughput ceiling of the machine, not the file's frame rate.
+
+  gl  OffscreenRenderer: libmpv's OpenGL render API into an FBO on a QOffscreenSurface
+  sw  SoftwareVideoPlayer: libmpv's software render API into its reused QImage, then the
+      QPainter blit its paintEvent does (into an image instead of the screen)
+
+--software forces Mesa's llvmpipe for the gl path, like on the build boxes.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from _common import load_app, make_test_media, print_table
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def run_gl(app, source, width, height, max_frames):
+    renderer = app.OffscreenRenderer(width, height)
+    try:
+        return renderer.run(source, max_frames=max_frames)
+    finally:
+        renderer.close()
+
+
+def run_sw(app, source, width, height, max_frames, timeout=300.0):
+    import mpv
+    from PyQt6.QtGui import QImage, QPainter
+
+    player = app.SoftwareVideoPlayer()
+    player.attach_mpv(mpv.MPV(vo="libmpv", ao="null", audio="no", untimed=True, hwdec="no", idle=True, ytdl=False))
+    player.ctx = mpv.MpvRenderContext(player.mpv, api_type="sw")
+    frame_ready = threading.Event()
+    player.ctx.update_cb = frame_ready.set
+    ended = threading.Event()
+
+    @player.mpv.event_callback("end-file")
+    def on_end(event):
+        ended.set()
+
+    frame = QImage(width, height, QImage.Format.Format_RGBX8888)
+    screen = QImage(width, height, QImage.Format.Format_RGB32)
+    render_times = []
+    player.mpv.loadfile(source)
+    start = time.perf_counter()
+    while not ended.is_set() and time.perf_counter() < start + timeout:
+        if max_frames is not None and len(render_times) >= max_frames:
+            break
+        if not frame_ready.wait(0.1):
+            continue
+        frame_ready.clear()
+        if player.ctx.update():
+            t = time.perf_counter()
+            player.render_into(frame)
+            painter = QPainter(screen)
+            painter.drawImage(0, 0, frame)
+            painter.end()
+            player.ctx.report_swap()
+            render_times.append((time.perf_counter() - t) * 1000)
+    seconds = time.perf_counter() - start
+    player.close()
+
+    return {
+        "frames": len(render_times),
+        "seconds": seconds,
+        "fps": len(render_times) / seconds if seconds else 0.0,
+        "render_ms": {
+            "p50": app._percentile(render_times, 50),
+            "p95": app._percentile(render_times, 95),
+            "max": max(render_times, default=0.0),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="render this file instead of generated test media")
+    parser.add_argument("--size", default="1920x1080", help="generated video size")
+    parser.add_argument("--rate", type=int, default=60, help="generated video frame rate")
+    parser.add_argument("--duration", type=int, default=10, help="generated video length in seconds")
+    parser.add_argument("--output", help="render target size (default: the video size)")
+    parser.add_argument("--frames", type=int, help="stop after this many frames")
+    parser.add_argument("--renderer", nargs="+", default=["gl", "sw"], choices=["gl", "sw"])
+    parser.add_argument("--software", action="store_true", help="force Mesa llvmpipe (LIBGL_ALWAYS_SOFTWARE=1)")
+    args = parser.parse_args()
+
+    if args.software:
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+
+    from PyQt6.QtWidgets import QApplication
+    qt = QApplication.instance() or QApplication(sys.argv)
+    app = load_app()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.file or make_test_media(
+            os.path.join(tmp, "source.mkv"), 0, args.duration, size=args.size, rate=args.rate
+        )
+        width, height = parse_size(args.output or args.size)
+        rows = []
+        for name in args.renderer:
+            try:
+                result = {"gl": run_gl, "sw": run_sw}[name](app, source, width, height, args.frames)
+            except RuntimeError as e:
+                rows.append([name, "-", "-", "-", "-", "-", "-"])
+                print(f"{name}: {e}")
+                continue
+            render = result["render_ms"]
+            rows.append([name, result["frames"], f"{result['seconds']:.2f}", f"{result['fps']:.1f}",
+                         f"{render['p50'] or 0:.2f}", f"{render['p95'] or 0:.2f}", f"{render['max']:.2f}"])
+
+    print(f"{os.path.basename(source)} rendered at {width}x{height}")
+    print_table(["renderer", "frames", "seconds", "fps", "render p50 ms", "render p95 ms", "render max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
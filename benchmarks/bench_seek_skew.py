@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Start skew across players after a seek: one-by-one seek/unpause versus SeekBarrier.
+
+    python3 benchmarks/bench_seek_skew.py [--tracks 1 2 4 8 16 32] [--rounds 5]
+
+Every player plays the same file to mpv's null audio output. After each seek and resume the
+players run for a moment, then each position is sampled together with the wall clock, so the
+spread of (position - elapsed time) is the skew between tracks regardless of sampling order.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import mpv
+
+from _common import load_app, make_test_media, print_table
+
+
+def open_players(source, count):
+    players = []
+    for _ in range(count):
+        player = mpv.MPV(video="no", ao="null", ytdl=False, input_default_bindings=False)
+        player.pause = True
+        with player.prepare_and_wait_for_event("file-loaded", timeout=10):
+            player.loadfile(source)
+        players.append(player)
+    return players
+
+
+def skew_ms(players, settle):
+    time.sleep(settle)
+    offsets = []
+    for player in players:
+        now = time.perf_counter()
+        offsets.append(player.time_pos - now)
+    return (max(offsets) - min(offsets)) * 1000
+
+
+def one_by_one(app, players, pos):
+    # What end_scrub used to do: seek each player, then unpause each
+    for player in players:
+        player.seek(pos, reference="absolute")
+    for player in players:
+        player.pause = False
+
+
+def barrier(app, players, pos):
+    app.SeekBarrier(players).run(pos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--settle", type=float, default=0.5, help="seconds of playback before sampling")
+    args = parser.parse_args()
+
+    app = load_app()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source = make_test_media(os.path.join(tmp, "source.mkv"), 1, 120, video=False)
+        for count in args.tracks:
+            players = open_players(source, count)
+            results = {}
+            for name, method in (("one by one", one_by_one), ("barrier", barrier)):
+                skews = []
+                for round_index in range(args.rounds):
+                    for player in players:
+                        player.pause = True
+                    method(app, players, 10.0 + round_index * 10)
+                    skews.append(skew_ms(players, args.settle))
+                results[name] = statistics.median(skews)
+            for player in players:
+                player.terminate()
+            rows.append([count, f"{results['one by one']:.1f}", f"{results['barrier']:.1f}"])
+
+    print(f"Median start skew (ms) over {args.rounds} seeks")
+    print_table(["tracks", "one by one", "barrier"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Audio/video sync regression harness on synthetic beep/flash media.
+
+    python3 benchmarks/sync_harness.py [--tracks 4] [--duration 60] [--codec aac] [--mode extract] [--offline-only]
+    xvfb-run -s "-screen 0 640x480x24" python3 benchmarks/sync_harness.py --capture
+
+The test file has a white flash in the video and a beep on every audio track (a different pitch
+per track) every --period seconds, all at the same timestamps. Measured per track:
+
+  content  - beep onsets found in the extracted track files (ffmpeg silencedetect) against the
+             timestamps they were generated at, i.e. any shift the extraction introduces
+  output   - with --capture: what actually comes out while the real VideoPlayer/AudioManager/
+             SyncController/SeekBarrier go through play, seek and scrub sequences. The video
+             widget is shown on the X display and the audio players play into a PulseAudio null
+             sink; one ffmpeg run records both (x11grab + the sink's monitor) on the same wall
+             clock. Flashes are found with signalstats, each track's beeps with a bandpass at its
+             pitch plus silencedetect, and every beep is reported minus the nearest flash.
+             Needs an X display (Xvfb is fine), pactl and a PulseAudio/PipeWire server.
+  reported - each audio player's time_pos against the video clock during the same sequences.
+             Output latency and pipeline offsets don't show up here, only in "output".
+
+Run it before and after a sync change.
+"""
+import argparse
+import os
+import random
+import re
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from _common import load_app, print_table
+
+FREQUENCIES = [440, 660, 880, 1100, 1320, 1540, 1760, 1980]
+
+
+def make_sync_media(path, tracks, duration, period, codec):
+    """Video flashing white and `tracks` audio tracks beeping (50 ms) at every multiple of `period`"""
+    cmd = [
+        "ffmpeg", "-v", "error", "-nostdin", "-y",
+        "-f", "lavfi", "-i",
+        f"color=c=black:s=320x240:r=30:d={duration},"
+        f"geq=lum='if(lt(mod(T\\,{period})\\,0.1)\\,235\\,16)':cb=128:cr=128",
+    ]
+    for i in range(tracks):
+        freq = FREQUENCIES[i % len(FREQUENCIES)]
+        cmd.extend([
+            "-f", "lavfi", "-i",
+            f"aevalsrc='sin(2*PI*{freq}*t)*lt(mod(t\\,{period})\\,0.05)':s=48000:d={duration}",
+        ])
+    cmd.extend(["-map", "0:v"])
+    for i in range(tracks):
+        cmd.extend(["-map", f"{i + 1}:a"])
+    cmd.extend(["-c:v", "mpeg4", "-q:v", "5", "-c:a", codec, path])
+    subprocess.run(cmd, check=True)
+    return path
+
+
+def beep_onsets(path):
+    """Times (seconds) where silence ends in an audio file"""
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-i", path, "-af", "silencedetect=n=-40dB:d=0.5", "-f", "null", "-"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return [float(value) for value in re.findall(r"silence_end: ([-\d.]+)", result.stderr)]
+
+
+def flash_onsets(path):
+    """Wall clock times (recording timestamps) of the frames where the captured video turns bright"""
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-copyts", "-i", path, "-map", "0:v",
+         "-vf", "signalstats,metadata=print:key=lavfi.signalstats.YAVG:file=-", "-f", "null", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    frames = re.findall(r"pts_time:([\d.]+)\s+lavfi\.signalstats\.YAVG=([\d.]+)", result.stdout)
+    onsets = []
+    dark = True
+    for pts, luma in frames:
+        bright = float(luma) > 128
+        if bright and dark:
+            onsets.append(float(pts))
+        dark = not bright
+    return onsets
+
+
+def _beep_filter(frequency):
+    band = f"bandpass=f={frequency}:width_type=h:w=40"
+    return ",".join([band] * 3)
+
+
+def captured_beep_onsets(path, frequency, stream="0:a"):
+    """Times where one track's beep (isolated by its pitch) starts in `stream`.
+
+    The detection threshold sits 12 dB under the filtered peak, so mixer gains don't matter
+    and the other tracks' beeps (which leak through the filter far weaker) are ignored.
+    """
+    level = subprocess.run(
+        ["ffmpeg", "-nostdin", "-i", path, "-map", stream, "-af", f"{_beep_filter(frequency)},volumedetect",
+         "-f", "null", "-"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    peak = re.search(r"max_volume: ([-\d.]+) dB", level.stderr)
+    if not peak:
+        return []
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-copyts", "-i", path, "-map", stream,
+         "-af", f"{_beep_filter(frequency)},silencedetect=n={float(peak.group(1)) - 12}dB:d=0.5",
+         "-f", "null", "-"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return [float(value) for value in re.findall(r"silence_end: ([-\d.]+)", result.stderr)]
+
+
+def detector_delay(source, track, period):
+    """How late captured_beep_onsets fires (filter delay), from the source track's known beep times"""
+    onsets = captured_beep_onsets(source, FREQUENCIES[track % len(FREQUENCIES)], f"0:a:{track}")
+    lags = [t - round(t / period) * period for t in onsets]
+    return statistics.median(lags) if lags else 0.0
+
+
+def output_offsets(capture_path, source, tracks, period, phases):
+    """Per phase and track: ms from each captured flash to the same beat's captured beep"""
+    flashes = flash_onsets(capture_path)
+    result = {name: [[] for _ in range(tracks)] for name in phases}
+    if not flashes:
+        return result
+    for track in range(tracks):
+        delay = detector_delay(source, track, period)
+        for beep in captured_beep_onsets(capture_path, FREQUENCIES[track % len(FREQUENCIES)]):
+            beep -= delay
+            flash = min(flashes, key=lambda f: abs(f - beep))
+            if abs(beep - flash) > period / 2:
+                continue
+            for name, windows in phases.items():
+                if any(start <= flash <= end for start, end in windows):
+                    result[name][track].append((beep - flash) * 1000)
+    return result
+
+
+class Capture:
+    """One ffmpeg recording of an X display area and a PulseAudio null sink's monitor.
+
+    Both inputs are timestamped from the wall clock, and -copyts keeps those timestamps, so
+    recording times compare with time.time().
+    """
+
+    def __init__(self, path, x, y, width, height):
+        self.path = path
+        self.sink = f"crusty_sync_{os.getpid()}"
+        self.module = subprocess.run(
+            ["pactl", "load-module", "module-null-sink", f"sink_name={self.sink}"],
+            stdout=subprocess.PIPE, check=True, text=True,
+        ).stdout.strip()
+        self.proc = subprocess.Popen([
+            "ffmpeg", "-v", "error", "-nostdin", "-y",
+            "-f", "x11grab", "-framerate", "60", "-video_size", f"{width}x{height}",
+            "-i", f"{os.environ['DISPLAY']}+{x},{y}",
+            "-f", "pulse", "-i", f"{self.sink}.monitor",
+            "-copyts", "-c:v", "ffv1", "-c:a", "pcm_s16le", path,
+        ])
+
+    @property
+    def audio_device(self):
+        return f"pulse/{self.sink}"
+
+    def stop(self):
+        # SIGINT lets ffmpeg finish the file
+        self.proc.send_signal(signal.SIGINT)
+        self.proc.wait()
+        subprocess.run(["pactl", "unload-module", self.module])
+
+
+def summarize(app, values):
+    if not values:
+        return ["-"] * 4
+    return [
+        f"{min(values):+.1f}",
+        f"{sum(values) / len(values):+.1f}",
+        f"{app._percentile([abs(v) for v in values], 95):.1f}",
+        f"{max(values):+.1f}",
+    ]
+
+
+def content_offsets(app, manager, source, period):
+    """Per track: ms between each beep found in the extracted file and where it was generated"""
+    offsets = []
+    for path in manager.temp_files:
+        errors = []
+        for onset in beep_onsets(path):
+            expected = round(onset / period) * period
+            errors.append((onset - expected) * 1000)
+        offsets.append(errors)
+    return offsets
+
+
+class Runtime:
+    """The player objects MainWindow uses. Without `capture` there is no window and mpv outputs
+    nothing; with it the video widget is shown at `geometry` and the audio plays into its sink."""
+
+    def __init__(self, app, source, settings, capture=None, geometry=None):
+        import mpv
+        from PyQt6.QtWidgets import QApplication
+
+        self.app = app
+        self.qt = QApplication.instance() or QApplication(sys.argv)
+        if capture is None:
+            self.video = app.VideoPlayer()
+            self.video.attach_mpv(mpv.MPV(vo="null", ao="null", keep_open=True, idle=True, ytdl=False))
+        else:
+            # The widget creates its libmpv-rendered instance when shown
+            self.video = app.create_video_player(settings.get("video_renderer", "auto"))
+            self.video.setWindowFlag(app.Qt.WindowType.FramelessWindowHint)
+            self.video.setGeometry(*geometry)
+            self.video.show()
+            while self.video.mpv is None:
+                self.qt.processEvents()
+        with self.video.mpv.prepare_and_wait_for_event("file-loaded", timeout=10):
+            self.video.set_media(source)
+        self.video.set_video_muted()
+
+        self.audio = app.AudioManager(settings=settings)
+        self.audio.player_options = {"ao": "null"} if capture is None else {"ao": "pulse", "audio_device": capture.audio_device}
+        self.audio.open_audio_tracks(source)
+        for player in self.audio.audio_players:
+            player.wait_for_property("duration", timeout=30)
+        self.sync = app.SyncController(settings)
+        self.use_sync = True
+        self.windows = []  # (start, end) wall clock times of the steady playback just measured
+
+    def wait(self, seconds):
+        # Keep the Qt event loop running so the shown widget repaints
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            self.qt.processEvents()
+            time.sleep(0.002)
+
+    def players(self):
+        return [self.video.mpv] + self.audio.audio_players
+
+    def offsets(self):
+        """Each audio player's reported position minus the video clock read right next to it (ms)"""
+        result = []
+        for player in self.audio.audio_players:
+            video_pos = self.video.clock()
+            pos = player.time_pos
+            if pos is None or video_pos is None:
+                result.append(None)
+            else:
+                result.append((pos - video_pos) * 1000)
+        return result
+
+    def run_for(self, seconds, samples):
+        # What MainWindow.update_timeline does every 50 ms during playback
+        start = time.time()
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            for i, offset in enumerate(self.offsets()):
+                if offset is not None:
+                    samples[i].append(offset)
+            if self.use_sync:
+                self.sync.update(self.video.clock, self.audio.audio_players)
+            self.wait(0.05)
+        self.windows.append((start, time.time()))
+
+    def pause(self):
+        self.video.pause()
+        self.audio.pause()
+        self.sync.reset(self.audio.audio_players)
+
+    def play(self, seconds, samples):
+        self.app.SeekBarrier(self.audio.audio_players, [self.video.mpv]).run(self.video.mpv.time_pos or 0.0)
+        self.run_for(seconds, samples)
+
+    def seek(self, target, seconds, samples):
+        self.pause()
+        self.app.SeekBarrier(self.players()).run(target)
+        self.run_for(seconds, samples)
+
+    def scrub(self, start, end, seconds, samples):
+        # Drag from start to end like the timeline does, then release
+        self.pause()
+        for step in range(30):
+            self.video.scrub_to(int((start + (end - start) * step / 29) * 1000))
+            self.wait(0.01)
+        self.video.end_scrub()
+        self.app.SeekBarrier(self.players()).run(end)
+        self.run_for(seconds, samples)
+
+    def close(self):
+        self.audio.cleanup_on_close()
+        self.audio.cleanup_temp_files()
+        self.video.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=4)
+    parser.add_argument("--duration", type=int, default=60, help="test media length in seconds")
+    parser.add_argument("--period", type=float, default=2.0, help="seconds between beeps/flashes")
+    parser.add_argument("--codec", default="aac", help="audio codec of the test file")
+    parser.add_argument("--mode", default="extract", choices=["extract", "direct"])
+    parser.add_argument("--seeks", type=int, default=5)
+    parser.add_argument("--no-sync", action="store_true", help="leave SyncController out of the loop")
+    parser.add_argument("--offline-only", action="store_true", help="only the content check, no mpv needed")
+    parser.add_argument("--capture", action="store_true", help="measure the actual video/audio output (see above)")
+    parser.add_argument("--renderer", default="auto", choices=["auto", "opengl", "software"],
+                        help="video widget for --capture")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    app = load_app()
+    settings = {"audio_mode": args.mode, "cache_budget_mb": 0, "probe_db_max_rows": 0,
+                "video_renderer": args.renderer}
+    random.seed(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = make_sync_media(os.path.join(tmp, "sync.mkv"), args.tracks, args.duration, args.period, args.codec)
+        header = ["track", "min ms", "mean ms", "p95 |ms|", "max ms"]
+
+        if args.mode == "extract":
+            manager = app.AudioManager(settings=settings)
+            manager.player_options = {"ao": "null"}
+            manager.extract_audio_tracks(source)
+            content = content_offsets(app, manager, source, args.period)
+            manager.cleanup_on_close()
+            manager.cleanup_temp_files()
+            print(f"content: beep onsets in the extracted {args.codec} tracks vs. generated timestamps")
+            print_table(header, [[i + 1] + summarize(app, errors) for i, errors in enumerate(content)])
+            print()
+
+        if args.offline_only:
+            return
+
+        capture = None
+        geometry = (0, 0, 320, 240)
+        if args.capture:
+            if not os.environ.get("DISPLAY") or not shutil.which("pactl"):
+                sys.exit("--capture needs an X display (e.g. xvfb-run) and pactl with a PulseAudio/PipeWire server")
+            capture = Capture(os.path.join(tmp, "capture.mkv"), *geometry)
+
+        phases = {name: [[] for _ in range(args.tracks)] for name in ("play", "seek", "scrub")}
+        windows = {}
+        try:
+            runtime = Runtime(app, source, settings, capture, geometry)
+        except BaseException:
+            if capture:
+                capture.stop()
+            raise
+        runtime.use_sync = not args.no_sync
+        try:
+            runtime.play(5.0, phases["play"])
+            windows["play"], runtime.windows = runtime.windows, []
+            for _ in range(args.seeks):
+                runtime.seek(random.uniform(0, args.duration - 5), 2.0, phases["seek"])
+            windows["seek"], runtime.windows = runtime.windows, []
+            for _ in range(args.seeks):
+                start = random.uniform(0, args.duration - 5)
+                runtime.scrub(start, random.uniform(0, args.duration - 5), 2.0, phases["scrub"])
+            windows["scrub"], runtime.windows = runtime.windows, []
+        finally:
+            runtime.close()
+            if capture:
+                capture.stop()
+
+        sync_note = "without" if args.no_sync else "with"
+        if capture:
+            for name, offsets in output_offsets(capture.path, source, args.tracks, args.period, windows).items():
+                print(f"output/{name}: captured beep minus captured flash ({sync_note} SyncController)")
+                print_table(header, [[i + 1] + summarize(app, values) for i, values in enumerate(offsets)])
+                print()
+        for name, samples in phases.items():
+            print(f"reported/{name}: audio time_pos minus video clock ({sync_note} SyncController)")
+            print_table(header, [[i + 1] + summarize(app, values) for i, values in enumerate(samples)])
+            print()
+
+
+if __name__ == "__main__":
+    main()